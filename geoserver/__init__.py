@@ -1,3 +1,4 @@
+from .aio import AsyncGeoServer, AsyncGeoWebCache
 from .geoserver import GeoServer
 from .geowebcache import GeoWebCache
 
@@ -0,0 +1,74 @@
+import asyncio
+from functools import partial, wraps
+from typing import Any, ClassVar, Type
+
+from .base import Base
+from .geoserver import GeoServer
+from .geowebcache import GeoWebCache
+
+
+class AsyncGeoServer:
+    """Asynchronous facade over the `GeoServer` client.
+
+    This class mirrors every public method of `GeoServer` as a coroutine. Each call runs the
+    underlying request in a worker thread, so independent REST calls can be gathered concurrently
+    while sharing the client's pooled keep-alive connections.
+
+    Args:
+        *args: Positional arguments forwarded to `GeoServer`.
+        **kwargs: Keyword arguments forwarded to `GeoServer`.
+
+    Example:
+        ```python
+        import asyncio
+
+        from geoserver import AsyncGeoServer
+
+
+        async def main() -> None:
+            async with AsyncGeoServer(username="admin", password="geoserver") as geoserver:
+                users, roles = await asyncio.gather(geoserver.get_users(), geoserver.get_roles())
+
+        asyncio.run(main())
+        ```
+    """
+
+    client_class: ClassVar[Type[Base]] = GeoServer
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.client = self.client_class(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.client, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        @wraps(attr)
+        async def method(*args: Any, **kwargs: Any) -> Any:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, partial(attr, *args, **kwargs))
+
+        return method
+
+    async def close(self) -> None:
+        """Releases the pooled connections held by the underlying client."""
+        self.client.close()
+
+    async def __aenter__(self) -> "AsyncGeoServer":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+
+class AsyncGeoWebCache(AsyncGeoServer):
+    """Asynchronous facade over the `GeoWebCache` client.
+
+    Works exactly like `AsyncGeoServer`: every public method of `GeoWebCache` is exposed as a
+    coroutine running on a worker thread over the client's pooled connections.
+    """
+
+    client_class = GeoWebCache
+
+    async def __aenter__(self) -> "AsyncGeoWebCache":
+        return self
@@ -1,14 +1,89 @@
+import json
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from io import BufferedReader
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, TypedDict, Union
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Type, TypedDict, TypeVar, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import AuthBase, HTTPBasicAuth
 from typing_extensions import Unpack
+from urllib3.util.retry import Retry
 
 from .exceptions import GeoServerError
 from .utils import find_html_body, find_html_description_section, find_html_message_section, is_html
 
+try:
+    # Optional speedup: orjson parses large catalog responses 2-5x faster than the stdlib
+    # decoder and consumes the raw bytes directly, skipping the charset decode step.
+    import orjson
+
+    def _loads(content: bytes) -> Any:
+        return orjson.loads(content)
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:
+
+    def _loads(content: bytes) -> Any:
+        return json.loads(content)
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+try:
+    # Optional speedup: when a brotli implementation is installed, urllib3 decodes "br" responses
+    # transparently, so we can advertise it and cut bytes on the wire for large catalog listings.
+    import brotli  # noqa: F401
+
+    _ACCEPT_ENCODING = "br, gzip, deflate"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+
+        _ACCEPT_ENCODING = "br, gzip, deflate"
+    except ImportError:
+        _ACCEPT_ENCODING = "gzip, deflate"
+
+try:
+    # Optional speedup: urllib3 v2 decodes "zstd" transparently when the zstandard package is
+    # installed; zstd decompresses markedly faster than gzip at comparable ratios.
+    import urllib3
+    import zstandard  # noqa: F401
+
+    if int(urllib3.__version__.split(".")[0]) >= 2:
+        _ACCEPT_ENCODING = "zstd, " + _ACCEPT_ENCODING
+except ImportError:
+    pass
+
+
+T = TypeVar("T")
+U = TypeVar("U")
+B = TypeVar("B", bound="Base")
+
+# Accepted HTTP verbs, hoisted so _request validates against a prebuilt set instead of
+# rebuilding a list on every call.
+_HTTP_METHODS = frozenset(("get", "post", "put", "delete", "head"))
+
+# REST round-trips are small request/small response: disable Nagle's algorithm so sub-MTU bodies
+# are sent immediately, and keep pooled sockets alive between bursts of calls.
+_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+
+class _RestAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs["socket_options"] = _SOCKET_OPTIONS
+        return super().init_poolmanager(*args, **kwargs)
+
 
 class RequestParams(TypedDict, total=False):
     data: Any
@@ -21,6 +96,8 @@ class RequestParams(TypedDict, total=False):
     proxies: Any
     verify: bool
     cert: Optional[str]
+    stream: bool
+    timeout: Optional[float]
 
 
 class Base:
@@ -36,29 +113,231 @@ class Base:
         proxies: Any = None,
         verify: bool = True,
         cert: Optional[str] = None,
+        cache_ttl: float = 0.0,
+        timeout: Optional[float] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 20,
+        max_retries: int = 0,
+        session: Optional[requests.Session] = None,
+        prewarm: bool = False,
     ):
         if auth is None and username is not None and password is not None:
             auth = HTTPBasicAuth(username, password)
 
         self.service_url = service_url.rstrip("/")
+        # Precomputed once so per-call URL construction does not rebuild the common REST prefix.
+        self._rest_url = self.service_url + "/rest"
         self.auth = auth
         self.headers = headers or {}
+        self.headers.setdefault("Accept", "application/json, application/xml;q=0.9, */*;q=0.8")
+        self.headers.setdefault("Accept-Encoding", _ACCEPT_ENCODING)
         self.cookies = cookies or {}
         self.allow_redirects = allow_redirects
         self.proxies = proxies or {}
         self.verify = verify
         self.cert = cert
+        self.cache_ttl = cache_ttl
+        self.timeout = timeout
+        # The urllib3 connection pool is thread-safe, so a single client can be shared by many
+        # threads; only the in-process cache needs its own lock.
+        self._cache: Dict[Any, Any] = {}
+        self._cache_lock = threading.Lock()
+        # A single Session keeps the TCP/TLS connection alive between calls, so consecutive
+        # requests to the same GeoServer skip the handshake round-trips. A caller-provided session
+        # (e.g. one shared across clients, or pre-configured with custom adapters) is used as-is
+        # and left open on close().
+        self._owns_session = session is None
+        if session is not None:
+            self._session = session
+        else:
+            self._session = requests.Session()
+            # Opt-in retries smooth transient 5xx responses from a loaded GeoServer; backoff keeps
+            # bulk operations from hammering a server that is already struggling.
+            retries: Union[Retry, int] = 0
+            if max_retries > 0:
+                retries = Retry(
+                    total=max_retries,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 502, 503, 504],
+                    allowed_methods=frozenset({"GET", "HEAD", "PUT", "POST", "DELETE"}),
+                    respect_retry_after_header=True,
+                )
+            adapter = _RestAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retries)
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+
+        if prewarm:
+            # Pay DNS + TCP + TLS during construction so the first real call skips the handshake
+            # round-trips; short-lived CLI invocations benefit most. Failures are left for the
+            # first real call to surface.
+            try:
+                self._session.head(
+                    f"{self._rest_url}/about/version", auth=self.auth, verify=self.verify, timeout=self.timeout or 10
+                )
+            except requests.RequestException:
+                pass
+
+    def _decode(self, response: requests.Response, format: str) -> Any:
+        return _loads(response.content) if format == "json" else response.text
+
+    def _map_concurrently(self, func: Callable[[T], U], items: Iterable[T], *, max_workers: int = 8) -> List[U]:
+        # Fan independent REST calls out over a thread pool. The calls are network-bound, so a few
+        # threads are enough to overlap the round-trips. Results keep the order of `items`.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(func, items))
+
+    def close(self) -> None:
+        """Releases the pooled connections held by the client.
+
+        Caller-provided sessions are left open, since they may be shared with other clients.
+        """
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self: B) -> B:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @classmethod
+    def from_env(cls: Type[B], **kwargs: Any) -> B:
+        """Builds a client from the `GEOSERVER_URL`, `GEOSERVER_USER` and `GEOSERVER_PASSWORD`
+        environment variables. Keyword arguments take precedence over the environment.
+
+        A single client can safely be shared by many threads (the connection pool is thread-safe),
+        so web applications should create one instance per process and reuse it.
+        """
+        kwargs.setdefault("service_url", os.environ.get("GEOSERVER_URL", "http://localhost:8080/geoserver"))
+        kwargs.setdefault("username", os.environ.get("GEOSERVER_USER"))
+        kwargs.setdefault("password", os.environ.get("GEOSERVER_PASSWORD"))
+        return cls(**kwargs)
+
+    def invalidate_cache(self, prefix: Optional[str] = None) -> None:
+        with self._cache_lock:
+            if prefix is None:
+                self._cache.clear()
+                return
+            for key in [key for key in self._cache if key[0].startswith(prefix)]:
+                del self._cache[key]
+
+    def _invalidate_related(self, url: str) -> None:
+        # Drop cached entries that may be affected by a mutation of `url`. Cached URLs carry a
+        # format extension while mutated URLs usually do not, so compare without the extension.
+        # Mutating an item also staleness its parent collection listing, whose URL differs in the
+        # last segment (e.g. /usergroup/user/{name} vs /usergroup/users), so the item's parent
+        # path participates in the match as well.
+        mutated = url.split("?", 1)[0]
+        parent = mutated.rsplit("/", 1)[0]
+        # A POST to a top-level collection has the bare REST root as parent; matching on it would
+        # wipe the whole cache, so the parent clause only applies below that level.
+        match_parent = len(parent) > len(self._rest_url)
+        with self._cache_lock:
+            for key in list(self._cache):
+                cached = key[0].rsplit(".", 1)[0]
+                if mutated.startswith(cached) or cached.startswith(mutated):
+                    del self._cache[key]
+                elif match_parent and cached.startswith(parent):
+                    del self._cache[key]
+
+    def _get_formatted(
+        self,
+        url: str,
+        *,
+        format: str = "json",
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        response = self._request(method="get", url=url, params=params or {})
+        return self._decode(response, format)
+
+    def _cached_get(
+        self,
+        url: str,
+        *,
+        format: str = "json",
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        if self.cache_ttl <= 0:
+            response = self._request(method="get", url=url, params=params or {})
+            return self._decode(response, format)
+
+        key = (url, frozenset((params or {}).items()))
+        with self._cache_lock:
+            entry = self._cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.cache_ttl:
+            return entry[2]
+
+        # Expired entry: revalidate with a conditional GET when the server sent validators, so an
+        # unchanged resource costs a 304 round-trip instead of a full transfer and parse.
+        headers: Dict[str, Any] = {}
+        if entry is not None and entry[1] is not None:
+            etag, last_modified = entry[1]
+            if etag is not None:
+                headers["If-None-Match"] = etag
+            if last_modified is not None:
+                headers["If-Modified-Since"] = last_modified
+        response = self._request(method="get", url=url, params=params or {}, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            with self._cache_lock:
+                self._cache[key] = (time.monotonic(), entry[1], entry[2])
+            return entry[2]
+        value = self._decode(response, format)
+        validators = (response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), validators, value)
+        return value
+
+    def _cached_value(self, url: str, *, params: Optional[Dict[str, Any]] = None) -> Any:
+        # Returns the fresh cached value for a GET, or None when caching is off or the entry is
+        # missing or stale. Lets callers answer questions from listings already in memory.
+        if self.cache_ttl <= 0:
+            return None
+        key = (url, frozenset((params or {}).items()))
+        with self._cache_lock:
+            entry = self._cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.cache_ttl:
+            return entry[2]
+        return None
+
+    def _cached_exists(self, url: str, *, ignore: Optional[List[int]] = None) -> bool:
+        # Existence probes share the TTL cache: provisioning flows tend to test the same resource
+        # repeatedly, and a cached boolean saves the full HEAD round-trip on repeats. Mutations
+        # invalidate the entry centrally like any other cached read.
+        if self.cache_ttl <= 0:
+            response = self._request(method="head", url=url, ignore=ignore or [404])
+            return response.status_code == 200
+
+        key = (url, "exists")
+        resource = url.rsplit(".", 1)[0]
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                # A fresh cached GET of the same resource already proves it exists, so the common
+                # fetch-then-check (or check-then-fetch) pattern costs a single round-trip.
+                now = time.monotonic()
+                for other, cached in self._cache.items():
+                    if other[1] != "exists" and other[0].rsplit(".", 1)[0] == resource:
+                        if now - cached[0] < self.cache_ttl:
+                            entry = (cached[0], None, True)
+                            break
+        if entry is not None and time.monotonic() - entry[0] < self.cache_ttl:
+            return bool(entry[2])
+        response = self._request(method="head", url=url, ignore=ignore or [404])
+        value = response.status_code == 200
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), None, value)
+        return value
 
     def _request(
         self,
         method: Literal["post", "get", "put", "delete", "head"],
         url: str,
-        body: Optional[Union[str, Dict[str, Any]]] = None,
+        body: Optional[Union[str, bytes, Dict[str, Any]]] = None,
         file: Optional[Union[str, Path, BufferedReader]] = None,
         ignore: Optional[List[int]] = None,
         **kwargs: Unpack[RequestParams],
     ) -> requests.Response:
-        if method.lower() not in ["get", "post", "put", "delete", "head"]:
+        if method.lower() not in _HTTP_METHODS:
             raise ValueError(f"Invalid method {method!r}")
 
         # Default parameters
@@ -76,13 +355,27 @@ class Base:
         # If a body is provided (POST or PUT request), add respective headers (XML or JSON support)
         if isinstance(body, dict):
             params["headers"].update({"Content-Type": "application/json"})
-            params["json"] = body
+            params["data"] = _dumps(body)
+        elif isinstance(body, bytes):
+            # Pre-serialized body: callers sending the same payload many times (e.g. bulk
+            # provisioning) can serialize it once and skip the per-call encoding cost.
+            content_type = "text/xml" if body.lstrip().startswith(b"<") else "application/json"
+            params["headers"].update({"Content-Type": content_type})
+            params["data"] = body
         elif isinstance(body, str):
             params["headers"].update({"Content-Type": "text/xml"})
             params["data"] = body
 
-        # Override default parameters with user-provided parameters
-        params["params"] = kwargs.pop("params", {})
+        # Override default parameters with user-provided parameters.
+        # Unset query parameters are dropped here once, so call sites can pass them declaratively
+        # and the transport never urlencodes None values. Booleans are rendered lowercase: requests
+        # would send "True"/"False", which some GeoServer versions refuse to parse.
+        query = kwargs.pop("params", {})
+        params["params"] = (
+            {k: str(v).lower() if isinstance(v, bool) else v for k, v in query.items() if v is not None}
+            if query
+            else {}
+        )
         params["headers"].update({**kwargs.pop("headers", {})})
         params["cookies"].update({**kwargs.pop("cookies", {})})
         params["auth"] = kwargs.pop("auth", self.auth)
@@ -90,13 +383,21 @@ class Base:
         params["allow_redirects"] = kwargs.pop("allow_redirects", self.allow_redirects)
         params["verify"] = kwargs.pop("verify", self.verify)
         params["cert"] = kwargs.pop("cert", self.cert)
+        params["stream"] = kwargs.pop("stream", False)
+        params["timeout"] = kwargs.pop("timeout", self.timeout)
+        if "data" in kwargs:
+            params["data"] = kwargs.pop("data")
 
-        if file is None or not isinstance(file, (str, Path)):
-            response = requests.request(method.lower(), url, **params)
-        else:
+        # File uploads are handed to the transport as file objects, so requests streams them from
+        # disk in chunks and memory stays flat regardless of the upload size.
+        if isinstance(file, (str, Path)):
             with open(file, "rb") as f:
                 params["data"] = f
-                response = requests.request(method.lower(), url, **params)
+                response = self._session.request(method.lower(), url, **params)
+        else:
+            if file is not None:
+                params["data"] = file
+            response = self._session.request(method.lower(), url, **params)
 
         # Handle errors
         if not response.ok and response.status_code not in ignore:
@@ -108,4 +409,8 @@ class Base:
                     message += ". " if not message.endswith(".") else " "
                 message += find_html_description_section(body)
             raise GeoServerError(message=message, status_code=response.status_code)
+
+        # A successful mutation makes cached reads of the same resource (or its parent listing) stale
+        if self._cache and method.lower() not in ("get", "head"):
+            self._invalidate_related(url)
         return response
@@ -1,11 +1,88 @@
+import os
 import re
-import zipfile
 from io import BufferedReader
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Union, overload
+from typing import Any, Dict, Iterator, List, Literal, Optional, Tuple, Union, overload
+from urllib.parse import quote
 
 from .base import Base
 from .consts import CREATED_MESSAGE, DELETED_MESSAGE, OK_MESSAGE, UPDATED_MESSAGE
+from .utils import is_zip
+
+# Remote data store locations are published by reference rather than uploaded. Compiled once:
+# the prefix test runs on every upload call.
+_REMOTE_URL_RE = re.compile(r"\A(?:file:|https?://)")
+
+# The two possible quietOnNotFound query dicts, prebuilt because the detail getters that use them
+# tend to run in tight loops over thousands of resources.
+_QUIET_PARAMS = ({"quietOnNotFound": False}, {"quietOnNotFound": True})
+
+# Prebuilt query dicts for the two resource operations, same rationale as above.
+_RESOURCE_PARAMS = {
+    "default": {"operation": "default", "format": "json"},
+    "metadata": {"operation": "metadata", "format": "json"},
+}
+
+# Content types for upload extensions that need no sniffing.
+_UPLOAD_MIME = {".zip": "application/zip", ".tif": "image/tiff", ".tiff": "image/tiff"}
+
+# The content type for a style upload follows from the version attribute of the root
+# StyledLayerDescriptor tag. Callers that stream from disk pass only the document head;
+# callers that already hold the whole body in memory pass it unbounded.
+_SLD_VERSION_RE = re.compile(r'StyledLayerDescriptor[^>]*version="([^"]*)"')
+_SLD_CONTENT_TYPES = {"1.1": "application/vnd.ogc.se+xml", "1.1.0": "application/vnd.ogc.se+xml"}
+
+
+def _sld_content_type(document: str) -> str:
+    match = _SLD_VERSION_RE.search(document)
+    if not match:
+        raise ValueError("The SLD version could not be determined.")
+    return _SLD_CONTENT_TYPES.get(match.group(1), "application/vnd.ogc.sld+xml")
+
+
+def _quote(segment: str) -> str:
+    # User-provided names are dropped straight into URL paths; quoting keeps spaces and other
+    # special characters from producing a malformed request, in a single C-level call per segment.
+    return quote(segment, safe="")
+
+
+# URL templates for the role and user endpoints, keyed on which of the optional arguments are set.
+# A single table lookup replaces the five-way if/elif cascades repeated across the security
+# methods, and makes the valid argument combinations explicit in one place.
+_ROLE_QUERY_URLS: Dict[Tuple[bool, bool, bool], str] = {
+    (False, False, False): "/security/roles.{format}",
+    (True, False, False): "/security/roles/service/{service}.{format}",
+    (False, True, False): "/security/roles/group/{group}.{format}",
+    (True, True, False): "/security/roles/service/{service}/group/{group}.{format}",
+    (True, False, True): "/security/roles/service/{service}/user/{user}.{format}",
+}
+_ROLE_MEMBER_URLS: Dict[Tuple[bool, bool, bool], str] = {
+    (True, False, False): "/security/roles/service/{service}/role/{role}",
+    (False, False, True): "/security/roles/role/{role}/user/{user}",
+    (False, True, False): "/security/roles/role/{role}/group/{group}",
+    (True, False, True): "/security/roles/service/{service}/role/{role}/user/{user}",
+    (True, True, False): "/security/roles/service/{service}/role/{role}/group/{group}",
+}
+_USER_QUERY_URLS: Dict[Tuple[bool, bool], str] = {
+    (False, False): "/security/usergroup/users.{format}",
+    (True, False): "/security/usergroup/service/{service}/users.{format}",
+    (False, True): "/security/usergroup/group/{group}/users.{format}",
+}
+
+# Template endpoints keyed by which of (workspace, data_store, feature_type, coverage_store,
+# coverage) are provided; any other combination is invalid.
+_TEMPLATE_URLS: Dict[Tuple[bool, bool, bool, bool, bool], str] = {
+    (False, False, False, False, False): "/templates/{name}.ftl",
+    (True, False, False, False, False): "/workspaces/{workspace}/templates/{name}.ftl",
+    (True, True, False, False, False): "/workspaces/{workspace}/datastores/{data_store}/templates/{name}.ftl",
+    (True, True, True, False, False): (
+        "/workspaces/{workspace}/datastores/{data_store}/featuretypes/{feature_type}/templates/{name}.ftl"
+    ),
+    (True, False, False, True, False): "/workspaces/{workspace}/coveragestores/{coverage_store}/templates/{name}.ftl",
+    (True, False, False, True, True): (
+        "/workspaces/{workspace}/coveragestores/{coverage_store}/coverages/{coverage}/templates/{name}.ftl"
+    ),
+}
 
 
 class GeoServer(Base):
@@ -16,6 +93,10 @@ class GeoServer(Base):
         This class implements most of the GeoServer REST API endpoints.
         You can follow the official GeoServer REST API documentation [here](https://docs.geoserver.org/stable/en/user/rest/).
 
+        A single instance can safely be shared by many threads: the underlying connection pool is
+        thread-safe and sized for concurrent use. Create one client per process and reuse it
+        (e.g. via `GeoServer.from_env()`) instead of constructing one per request.
+
     Args:
         service_url: The URL of the GeoServer instance.
         username: The username to authenticate with the GeoServer instance.
@@ -27,6 +108,25 @@ class GeoServer(Base):
         proxies: The proxies to be included in the requests.
         verify: A boolean indicating whether or not the SSL certificates should be verified.
         cert: The certificate to be included in the requests.
+        cache_ttl: Optional. Number of seconds during which repeated identical read requests
+            (e.g. listing workspaces or stores) are served from an in-process cache instead of
+            hitting the server again. Defaults to 0 (caching disabled).
+        timeout: Optional. Number of seconds to wait for the server before giving up on a request.
+            A hanging request otherwise blocks its pooled connection indefinitely. Defaults to
+            None (no timeout).
+        pool_connections: Optional. The number of connection pools kept by the HTTP session.
+            Defaults to 10.
+        pool_maxsize: Optional. The maximum number of kept-alive connections per pool. Raise this
+            when fanning many concurrent requests out to the same GeoServer. Defaults to 20.
+        prewarm: Optional. When set to `True`, a cheap request is fired during construction so the
+            DNS/TCP/TLS handshake is paid up front instead of on the first real call. Defaults to
+            False.
+        session: Optional. A pre-configured `requests.Session` to issue requests through, e.g. one
+            shared across several clients. When provided it is used as-is (no adapters are
+            mounted) and left open by `close()`. Defaults to None.
+        max_retries: Optional. Number of times transient errors (502, 503, 504) are retried with
+            exponential backoff before surfacing. Note that retried POST requests must be
+            idempotent on the server side. Defaults to 0 (disabled).
 
     Example:
         ```python
@@ -89,10 +189,9 @@ class GeoServer(Base):
             ```
 
         """
-        url = f"{self.service_url}/rest/about/manifest.{format}"
+        url = f"{self._rest_url}/about/manifest.{format}"
         params = dict(manifest=manifest, key=key, value=value)
-        response = self._request(method="get", url=url, params=params)
-        return response.json() if format == "json" else response.text
+        return self._get_formatted(url, format=format, params=params)
 
     @overload
     def get_version(
@@ -140,10 +239,9 @@ class GeoServer(Base):
             geoserver.get_version()
             ```
         """
-        url = f"{self.service_url}/rest/about/version.{format}"
+        url = f"{self._rest_url}/about/version.{format}"
         params = dict(manifest=manifest, key=key, value=value)
-        response = self._request(method="get", url=url, params=params)
-        return response.json() if format == "json" else response.text
+        return self._get_formatted(url, format=format, params=params)
 
     @overload
     def get_status(
@@ -191,10 +289,9 @@ class GeoServer(Base):
             geoserver.get_status()
             ```
         """
-        url = f"{self.service_url}/rest/about/status.{format}"
+        url = f"{self._rest_url}/about/status.{format}"
         params = dict(manifest=manifest, key=key, value=value)
-        response = self._request(method="get", url=url, params=params)
-        return response.json() if format == "json" else response.text
+        return self._get_formatted(url, format=format, params=params)
 
     # System Status
 
@@ -220,9 +317,8 @@ class GeoServer(Base):
             geoserver.get_system_status()
             ```
         """
-        url = f"{self.service_url}/rest/about/system-status.{format}"
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        url = f"{self._rest_url}/about/system-status.{format}"
+        return self._get_formatted(url, format=format)
 
     # Data Stores
 
@@ -249,9 +345,26 @@ class GeoServer(Base):
             geoserver.get_data_stores(workspace="my_workspace")
             ```
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/datastores.{format}"
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        url = f"{self._rest_url}/workspaces/{_quote(workspace)}/datastores.{format}"
+        return self._get_formatted(url, format=format)
+
+    def bulk_get_data_stores(self, workspaces: List[str], *, max_workers: int = 8) -> List[Dict[str, Any]]:
+        """List the data stores of several workspaces.
+
+        The per-workspace listings are fetched concurrently over the pooled connections, so
+        enumerating a large catalog is bound by the slowest request instead of the sum of all
+        round-trips.
+
+        Args:
+            workspaces: The names of the workspaces.
+            max_workers: Optional. The number of concurrent requests. Defaults to 8.
+
+        Returns:
+            One data store listing per workspace, in the same order as the workspaces.
+        """
+        return self._map_concurrently(
+            lambda workspace: self.get_data_stores(workspace=workspace), workspaces, max_workers=max_workers
+        )
 
     def data_store_exists(self, name: str, *, workspace: str) -> bool:
         """Check if a data store exists in a workspace.
@@ -270,9 +383,8 @@ class GeoServer(Base):
             geoserver.data_store_exists("my_data_store", workspace="my_workspace")
             ```
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/datastores/{name}.xml"
-        response = self._request(method="head", url=url, ignore=[404])
-        return response.status_code == 200
+        url = f"{self._rest_url}/workspaces/{_quote(workspace)}/datastores/{_quote(name)}.xml"
+        return self._cached_exists(url)
 
     def create_data_store(self, body: Union[str, Dict[str, Any]], *, workspace: str) -> str:
         """Adds a new data store to the workspace.
@@ -305,7 +417,7 @@ class GeoServer(Base):
             geoserver.create_data_store(body, workspace="my_workspace")
             ```
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/datastores"
+        url = f"{self._rest_url}/workspaces/{_quote(workspace)}/datastores"
         self._request(method="post", url=url, body=body)
         return CREATED_MESSAGE
 
@@ -361,26 +473,28 @@ class GeoServer(Base):
         if isinstance(file, Path):
             file = file.as_posix()
         if isinstance(file, str):
-            name = name or Path(file).stem
-            filename = filename or f"{name}.{Path(file).suffix[1:]}"
+            # os.path is markedly cheaper than building Path objects just to split the file name.
+            base, ext = os.path.splitext(os.path.basename(file))
+            name = name or base
+            filename = filename or f"{name}.{ext[1:]}"
         if name is None:
             raise ValueError("The `store` parameter is required.")
 
         headers = {}
-        if zipfile.is_zipfile(file):
+        if is_zip(file):
             headers["Content-Type"] = "application/zip"
 
         params = dict(filename=filename, configure=configure)
         if overwrite:
             params["update"] = "overwrite"
 
-        if isinstance(file, str) and file.startswith(("file:", "http://", "https://")):
+        if isinstance(file, str) and _REMOTE_URL_RE.match(file):
             headers["Content-Type"] = "text/plain"
-            url = f"{self.service_url}/rest/workspaces/{workspace}/datastores/{name}/external.{format}"
+            url = f"{self._rest_url}/workspaces/{_quote(workspace)}/datastores/{_quote(name)}/external.{format}"
             self._request(method="put", url=url, data=file, params=params, headers=headers)
             return CREATED_MESSAGE
 
-        url = f"{self.service_url}/rest/workspaces/{workspace}/datastores/{name}/file.{format}"
+        url = f"{self._rest_url}/workspaces/{_quote(workspace)}/datastores/{_quote(name)}/file.{format}"
         self._request(method="put", url=url, file=file, params=params, headers=headers)
         return CREATED_MESSAGE
 
@@ -415,10 +529,9 @@ class GeoServer(Base):
             geoserver.get_data_store("my_data_store", workspace="my_workspace")
             ```
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/datastores/{name}.{format}"
-        params = dict(quietOnNotFound=quiet_on_not_found)
-        response = self._request(method="get", url=url, params=params)
-        return response.json() if format == "json" else response.text
+        url = f"{self._rest_url}/workspaces/{_quote(workspace)}/datastores/{_quote(name)}.{format}"
+        params = _QUIET_PARAMS[quiet_on_not_found]
+        return self._cached_get(url, format=format, params=params)
 
     def update_data_store(self, name: str, body: Union[str, Dict[str, Any]], *, workspace: str) -> str:
         """Modify a data store from a workspace.
@@ -444,7 +557,7 @@ class GeoServer(Base):
             geoserver.update_data_store("my_data_store", body, workspace="my_workspace")
             ```
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/datastores/{name}"
+        url = f"{self._rest_url}/workspaces/{_quote(workspace)}/datastores/{_quote(name)}"
         self._request(method="put", url=url, body=body)
         return UPDATED_MESSAGE
 
@@ -466,7 +579,7 @@ class GeoServer(Base):
             geoserver.delete_data_store("my_data_store", workspace="my_workspace")
             ```
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/datastores/{name}"
+        url = f"{self._rest_url}/workspaces/{_quote(workspace)}/datastores/{_quote(name)}"
         params = dict(recurse=recurse)
         self._request(method="delete", url=url, params=params)
         return DELETED_MESSAGE
@@ -492,7 +605,7 @@ class GeoServer(Base):
             geoserver.reset_data_store_caches("my_data_store", workspace="my_workspace")
             ```
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/datastores/{name}/reset"
+        url = f"{self._rest_url}/workspaces/{_quote(workspace)}/datastores/{_quote(name)}/reset"
         self._request(method="put", url=url)  # NOTE: Can also be a POST
         return OK_MESSAGE
 
@@ -552,12 +665,29 @@ class GeoServer(Base):
             geoserver.get_coverages(workspace="my_workspace", store="my_coverage_store")
             ```
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/coverages.{format}"
         if store is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/coveragestores/{store}/coverages.{format}"
+            url = f"{self._rest_url}/workspaces/{_quote(workspace)}/coveragestores/{_quote(store)}/coverages.{format}"
+        else:
+            url = f"{self._rest_url}/workspaces/{_quote(workspace)}/coverages.{format}"
+
+        return self._get_formatted(url, format=format, params=dict(list=list))
+
+    def bulk_get_coverages(self, stores: List[Tuple[str, str]], *, max_workers: int = 8) -> List[Dict[str, Any]]:
+        """List the coverages of several coverage stores.
+
+        The per-store listings are fetched concurrently over the pooled connections, so crawling
+        workspaces x stores is bound by the slowest request instead of the sum of all round-trips.
 
-        response = self._request(method="get", url=url, params=dict(list=list))
-        return response.json() if format == "json" else response.text
+        Args:
+            stores: The (workspace, store) pairs to query.
+            max_workers: Optional. The number of concurrent requests. Defaults to 8.
+
+        Returns:
+            One coverage listing per pair, in the same order as the pairs.
+        """
+        return self._map_concurrently(
+            lambda pair: self.get_coverages(workspace=pair[0], store=pair[1]), stores, max_workers=max_workers
+        )
 
     def create_coverage(self, body: Union[str, Dict[str, Any]], *, workspace: str, store: Optional[str] = None) -> str:
         """Creates a new coverage, the underlying data store must exist.
@@ -580,9 +710,10 @@ class GeoServer(Base):
             geoserver.create_coverage(body, workspace="my_workspace", store="my_coverage_store")
             ```
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/coverages"
         if store is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/coveragestores/{store}/coverages"
+            url = f"{self._rest_url}/workspaces/{_quote(workspace)}/coveragestores/{_quote(store)}/coverages"
+        else:
+            url = f"{self._rest_url}/workspaces/{_quote(workspace)}/coverages"
 
         self._request(method="post", url=url, body=body)
         return CREATED_MESSAGE
@@ -643,12 +774,12 @@ class GeoServer(Base):
             geoserver.get_coverage("my_coverage", workspace="my_workspace", store="my_coverage_store")
             ```
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/coverages/{name}.{format}"
         if store is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/coveragestores/{store}/coverages/{name}.{format}"
+            url = f"{self._rest_url}/workspaces/{_quote(workspace)}/coveragestores/{_quote(store)}/coverages/{_quote(name)}.{format}"
+        else:
+            url = f"{self._rest_url}/workspaces/{_quote(workspace)}/coverages/{_quote(name)}.{format}"
 
-        response = self._request(method="get", url=url, params=dict(quietOnNotFound=quiet_on_not_found))
-        return response.json() if format == "json" else response.text
+        return self._get_formatted(url, format=format, params=_QUIET_PARAMS[quiet_on_not_found])
 
     @overload
     def get_coverage_index(
@@ -706,14 +837,15 @@ class GeoServer(Base):
             geoserver.get_coverage_index("my_coverage", workspace="my_workspace", store="my_coverage_store")
             ```
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/coverages/{name}/index.{format}"
         if store is not None:
             url = (
-                f"{self.service_url}/rest/workspaces/{workspace}/coveragestores/{store}/coverages/{name}/index.{format}"
+                f"{self._rest_url}/workspaces/{_quote(workspace)}/coveragestores/{_quote(store)}"
+                f"/coverages/{_quote(name)}/index.{format}"
             )
+        else:
+            url = f"{self._rest_url}/workspaces/{_quote(workspace)}/coverages/{_quote(name)}/index.{format}"
 
-        response = self._request(method="get", url=url, params=dict(quietOnNotFound=quiet_on_not_found))
-        return response.json() if format == "json" else response.text
+        return self._get_formatted(url, format=format, params=_QUIET_PARAMS[quiet_on_not_found])
 
     def update_coverage(self, name: str, body: Union[str, Dict[str, Any]], *, workspace: str, store: str) -> str:
         """Update an individual coverage
@@ -737,7 +869,7 @@ class GeoServer(Base):
             geoserver.update_coverage("my_coverage", body, workspace="my_workspace", store="my_coverage_store")
             ```
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/coveragestores/{store}/coverages/{name}"
+        url = f"{self._rest_url}/workspaces/{_quote(workspace)}/coveragestores/{_quote(store)}/coverages/{_quote(name)}"
         self._request(method="put", url=url, body=body)
         return UPDATED_MESSAGE
 
@@ -760,7 +892,7 @@ class GeoServer(Base):
             geoserver.delete_coverage("my_coverage", workspace="my_workspace", store="my_coverage_store")
             ```
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/coveragestores/{store}/coverages/{name}"
+        url = f"{self._rest_url}/workspaces/{_quote(workspace)}/coveragestores/{_quote(store)}/coverages/{_quote(name)}"
         params = dict(recurse=recurse)
         self._request(method="delete", url=url, params=params)
         return DELETED_MESSAGE
@@ -789,7 +921,7 @@ class GeoServer(Base):
             geoserver.reset_coverage_caches("my_coverage", workspace="my_workspace", store="my_coverage_store")
             ```
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/coveragestores/{store}/coverages/{name}/reset"
+        url = f"{self._rest_url}/workspaces/{_quote(workspace)}/coveragestores/{_quote(store)}/coverages/{_quote(name)}/reset"
         self._request(method="put", url=url)  # NOTE: Can also be a POST
         return OK_MESSAGE
 
@@ -820,9 +952,8 @@ class GeoServer(Base):
             geoserver.get_coverage_stores(workspace="my_workspace")
             ```
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/coveragestores.{format}"
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        url = f"{self._rest_url}/workspaces/{workspace}/coveragestores.{format}"
+        return self._cached_get(url, format=format)
 
     def coveragestore_exists(self, name: str, *, workspace: str) -> bool:
         """Check if a coverage store exists in a workspace.
@@ -841,9 +972,35 @@ class GeoServer(Base):
             geoserver.coveragestore_exists("my_coverage_store", workspace="my_workspace")
             ```
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/coveragestores/{name}.xml"
-        response = self._request(method="head", url=url, ignore=[404])
-        return response.status_code == 200
+        # A fresh cached store listing answers membership without any round-trip, which is the
+        # common shape of "does each of these stores exist?" loops.
+        listing = self._cached_value(f"{self._rest_url}/workspaces/{workspace}/coveragestores.json")
+        if isinstance(listing, dict):
+            stores = listing.get("coverageStores")
+            if isinstance(stores, dict) and isinstance(stores.get("coverageStore"), list):
+                return any(store.get("name") == name for store in stores["coverageStore"])
+
+        url = f"{self._rest_url}/workspaces/{workspace}/coveragestores/{name}.xml"
+        return self._cached_exists(url)
+
+    def coveragestores_exist(self, names: List[str], *, workspace: str, max_workers: int = 8) -> Dict[str, bool]:
+        """Check which of several coverage stores exist in a workspace.
+
+        The existence probes are issued concurrently over the pooled connections, so checking a
+        batch of stores costs roughly one round-trip instead of one per store.
+
+        Args:
+            names: The names of the coverage stores.
+            workspace: The name of the workspace containing the coverage stores.
+            max_workers: Optional. The number of concurrent requests. Defaults to 8.
+
+        Returns:
+            A mapping of store name to whether it exists.
+        """
+        results = self._map_concurrently(
+            lambda name: self.coveragestore_exists(name, workspace=workspace), names, max_workers=max_workers
+        )
+        return dict(zip(names, results))
 
     def create_coverage_store(self, body: Union[str, Dict[str, Any]], *, workspace: str) -> str:
         """Adds a new coverage store.
@@ -868,7 +1025,7 @@ class GeoServer(Base):
             geoserver.create_coverage_store(body, workspace="my_workspace")
             ```
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/coveragestores"
+        url = f"{self._rest_url}/workspaces/{workspace}/coveragestores"
         self._request(method="post", url=url, body=body)
         return CREATED_MESSAGE
 
@@ -929,17 +1086,24 @@ class GeoServer(Base):
                 geoserver.upload_coverage_store(f, workspace="my_workspace", name="my_coverage_store", format="geotiff")
             ```
         """
+        ext = ""
         if isinstance(file, Path):
             file = file.as_posix()
         if isinstance(file, str):
-            name = name or Path(file).stem
-            filename = filename or f"{name}.{Path(file).suffix[1:]}"
+            base, ext = os.path.splitext(os.path.basename(file))
+            name = name or base
+            filename = filename or f"{name}.{ext[1:]}"
 
         if name is None:
             raise ValueError("The `name` parameter is required")
 
         headers = {}
-        if zipfile.is_zipfile(file):
+        # An unambiguous extension settles the content type without touching the file; the magic
+        # sniff only runs for unknown extensions and buffers.
+        content_type = _UPLOAD_MIME.get(ext.lower())
+        if content_type is not None:
+            headers["Content-Type"] = content_type
+        elif is_zip(file):
             headers["Content-Type"] = "application/zip"
 
         params = dict(
@@ -958,11 +1122,11 @@ class GeoServer(Base):
 
         if isinstance(file, str) and method in ["external", "url", "remote"]:
             headers["Content-Type"] = "text/plain"
-            url = f"{self.service_url}/rest/workspaces/{workspace}/coveragestores/{name}/{method}.{format}"
+            url = f"{self._rest_url}/workspaces/{workspace}/coveragestores/{name}/{method}.{format}"
             self._request(method="put", url=url, data=file, params=params, headers=headers)
             return CREATED_MESSAGE
 
-        url = f"{self.service_url}/rest/workspaces/{workspace}/coveragestores/{name}/file.{format}"
+        url = f"{self._rest_url}/workspaces/{workspace}/coveragestores/{name}/file.{format}"
         self._request(method="put", url=url, file=file, params=params, headers=headers)
         return CREATED_MESSAGE
 
@@ -997,9 +1161,8 @@ class GeoServer(Base):
             geoserver.get_coverage_store("my_coverage_store", workspace="my_workspace")
             ```
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/coveragestores/{name}.{format}"
-        response = self._request(method="get", url=url, params=dict(quietOnNotFound=quiet_on_not_found))
-        return response.json()
+        url = f"{self._rest_url}/workspaces/{workspace}/coveragestores/{name}.{format}"
+        return self._cached_get(url, format=format, params=_QUIET_PARAMS[quiet_on_not_found])
 
     def update_coverage_store(self, name: str, body: Union[str, Dict[str, Any]], *, workspace: str) -> str:
         """Modifies a single coverage store.
@@ -1022,7 +1185,7 @@ class GeoServer(Base):
             geoserver.update_coverage_store("my_coverage_store", body, workspace="my_workspace")
             ```
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/coveragestores/{name}"
+        url = f"{self._rest_url}/workspaces/{workspace}/coveragestores/{name}"
         self._request(method="put", url=url, body=body)
         return UPDATED_MESSAGE
 
@@ -1060,7 +1223,7 @@ class GeoServer(Base):
             geoserver.delete_coverage_store("my_coverage_store", workspace="my_workspace", recurse=True)
             ```
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/coveragestores/{name}"
+        url = f"{self._rest_url}/workspaces/{workspace}/coveragestores/{name}"
         params = dict(purge=purge, recurse=recurse)
         self._request(method="delete", url=url, params=params)
         return DELETED_MESSAGE
@@ -1086,7 +1249,7 @@ class GeoServer(Base):
             geoserver.reset_coverage_store_caches("my_coverage_store", workspace="my_workspace")
             ```
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/coveragestores/{name}/reset"
+        url = f"{self._rest_url}/workspaces/{workspace}/coveragestores/{name}/reset"
         self._request(method="put", url=url)
         return OK_MESSAGE
 
@@ -1100,15 +1263,33 @@ class GeoServer(Base):
     @overload
     def get_feature_types(self, *, workspace: str, store: Optional[str] = None, format: Literal["xml"]) -> str: ...
 
+    @overload
     def get_feature_types(
-        self, *, workspace: str, store: Optional[str] = None, format: Literal["json", "xml"] = "json"
-    ) -> Union[str, Dict[str, Any]]:
+        self,
+        *,
+        workspace: str,
+        store: Optional[str] = None,
+        format: Literal["json", "xml"] = "json",
+        stream: Literal[True],
+    ) -> Iterator[bytes]: ...
+
+    def get_feature_types(
+        self,
+        *,
+        workspace: str,
+        store: Optional[str] = None,
+        format: Literal["json", "xml"] = "json",
+        stream: bool = False,
+    ) -> Union[str, Dict[str, Any], Iterator[bytes]]:
         """List all feature types in the workspace.
 
         Args:
             workspace: The name of the workspace.
             store: The name of the data store.
             format: Optional. The format of the response. It can be either "json" or "xml". Defaults to "json".
+            stream: Optional. When set to `True`, the raw response is returned as an iterator of
+                chunks instead of being parsed, which is useful to forward or stream-parse very
+                large listings. Defaults to False.
 
         Returns:
             The list of all feature types in the workspace.
@@ -1120,12 +1301,15 @@ class GeoServer(Base):
             geoserver.get_feature_types(workspace="my_workspace")
             ```
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/featuretypes.{format}"
         if store is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/datastores/{store}/featuretypes.{format}"
+            url = f"{self._rest_url}/workspaces/{workspace}/datastores/{store}/featuretypes.{format}"
+        else:
+            url = f"{self._rest_url}/workspaces/{workspace}/featuretypes.{format}"
 
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        if stream:
+            response = self._request(method="get", url=url, stream=True)
+            return response.iter_content(chunk_size=65536)
+        return self._cached_get(url, format=format)
 
     def create_feature_type(
         self, body: Union[str, Dict[str, Any]], *, workspace: str, store: Optional[str] = None
@@ -1157,9 +1341,10 @@ class GeoServer(Base):
             geoserver.create_feature_type(body, workspace="my_workspace", store="my_data_store")
             ```
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/featuretypes"
         if store is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/datastores/{store}/featuretypes"
+            url = f"{self._rest_url}/workspaces/{workspace}/datastores/{store}/featuretypes"
+        else:
+            url = f"{self._rest_url}/workspaces/{workspace}/featuretypes"
 
         self._request(method="post", url=url, body=body)
         return CREATED_MESSAGE
@@ -1214,12 +1399,12 @@ class GeoServer(Base):
             geoserver.get_feature_type("my_feature_type", workspace="my_workspace")
             ```
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/featuretypes/{name}.{format}"
         if store is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/datastores/{store}/featuretypes/{name}.{format}"
+            url = f"{self._rest_url}/workspaces/{workspace}/datastores/{store}/featuretypes/{name}.{format}"
+        else:
+            url = f"{self._rest_url}/workspaces/{workspace}/featuretypes/{name}.{format}"
 
-        response = self._request(method="get", url=url, params=dict(quietOnNotFound=quiet_on_not_found))
-        return response.json() if format == "json" else response.text
+        return self._cached_get(url, format=format, params=_QUIET_PARAMS[quiet_on_not_found])
 
     def update_feature_type(
         self,
@@ -1266,9 +1451,10 @@ class GeoServer(Base):
             geoserver.update_feature_type("my_feature_type", body, workspace="my_workspace")
             ```
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/featuretypes/{name}"
         if store is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/datastores/{store}/featuretypes/{name}"
+            url = f"{self._rest_url}/workspaces/{workspace}/datastores/{store}/featuretypes/{name}"
+        else:
+            url = f"{self._rest_url}/workspaces/{workspace}/featuretypes/{name}"
 
         params = dict(recalculate=recalculate)
         self._request(method="put", url=url, body=body, params=params)
@@ -1301,9 +1487,10 @@ class GeoServer(Base):
             geoserver.delete_feature_type("my_feature_type", workspace="my_workspace", recurse=True)
             ```
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/featuretypes/{name}"
         if store is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/datastores/{store}/featuretypes/{name}"
+            url = f"{self._rest_url}/workspaces/{workspace}/datastores/{store}/featuretypes/{name}"
+        else:
+            url = f"{self._rest_url}/workspaces/{workspace}/featuretypes/{name}"
 
         params = dict(recurse=recurse)
         self._request(method="delete", url=url, params=params)
@@ -1337,9 +1524,10 @@ class GeoServer(Base):
             geoserver.reset_feature_type_caches("my_feature_type", workspace="my_workspace", store="my_data_store")
             ```
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/featuretypes/{name}/reset"
         if store is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/datastores/{store}/featuretypes/{name}/reset"
+            url = f"{self._rest_url}/workspaces/{workspace}/datastores/{store}/featuretypes/{name}/reset"
+        else:
+            url = f"{self._rest_url}/workspaces/{workspace}/featuretypes/{name}/reset"
 
         self._request(method="put", url=url)
         return OK_MESSAGE
@@ -1369,9 +1557,8 @@ class GeoServer(Base):
             geoserver.get_fonts()
             ```
         """
-        url = f"{self.service_url}/rest/fonts.{format}"
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        url = f"{self._rest_url}/fonts.{format}"
+        return self._cached_get(url, format=format)
 
     # Layer Groups
 
@@ -1402,12 +1589,12 @@ class GeoServer(Base):
             geoserver.get_layer_groups()
             ```
         """
-        url = f"{self.service_url}/rest/layergroups.{format}"
         if workspace is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/layergroups.{format}"
+            url = f"{self._rest_url}/workspaces/{workspace}/layergroups.{format}"
+        else:
+            url = f"{self._rest_url}/layergroups.{format}"
 
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        return self._cached_get(url, format=format)
 
     def layer_group_exists(self, name: str, *, workspace: Optional[str] = None) -> bool:
         """Check if a layer group exists.
@@ -1419,13 +1606,35 @@ class GeoServer(Base):
         Returns:
             True if the layer group exists, False otherwise.
         """
-        url = f"{self.service_url}/rest/layergroups/{name}.xml"
         if workspace is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/layergroups/{name}.xml"
+            url = f"{self._rest_url}/workspaces/{workspace}/layergroups/{name}.xml"
+        else:
+            url = f"{self._rest_url}/layergroups/{name}.xml"
 
         response = self._request(method="head", url=url, ignore=[404])
         return response.status_code == 200
 
+    def layer_groups_exist(
+        self, names: List[str], *, workspace: Optional[str] = None, max_workers: int = 8
+    ) -> Dict[str, bool]:
+        """Check which of several layer groups exist.
+
+        The existence probes are issued concurrently over the pooled connections, so checking a
+        batch of layer groups costs roughly one round-trip instead of one per group.
+
+        Args:
+            names: The names of the layer groups.
+            workspace: Optional. The name of the workspace.
+            max_workers: Optional. The number of concurrent requests. Defaults to 8.
+
+        Returns:
+            A mapping of layer group name to whether it exists.
+        """
+        results = self._map_concurrently(
+            lambda name: self.layer_group_exists(name, workspace=workspace), names, max_workers=max_workers
+        )
+        return dict(zip(names, results))
+
     def create_layer_group(self, body: Union[str, Dict[str, Any]], *, workspace: Optional[str] = None) -> str:
         """Create a new layer group.
 
@@ -1436,9 +1645,10 @@ class GeoServer(Base):
         Returns:
             The created layer group.
         """
-        url = f"{self.service_url}/rest/layergroups"
         if workspace is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/layergroups"
+            url = f"{self._rest_url}/workspaces/{workspace}/layergroups"
+        else:
+            url = f"{self._rest_url}/layergroups"
 
         self._request(method="post", url=url, body=body)
         return CREATED_MESSAGE
@@ -1482,12 +1692,12 @@ class GeoServer(Base):
         Returns:
             The requested layer group.
         """
-        url = f"{self.service_url}/rest/layergroups/{name}.{format}"
         if workspace is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/layergroups/{name}.{format}"
+            url = f"{self._rest_url}/workspaces/{workspace}/layergroups/{name}.{format}"
+        else:
+            url = f"{self._rest_url}/layergroups/{name}.{format}"
 
-        response = self._request(method="get", url=url, params=dict(quietOnNotFound=quiet_on_not_found))
-        return response.json() if format == "json" else response.text
+        return self._cached_get(url, format=format, params=_QUIET_PARAMS[quiet_on_not_found])
 
     def update_layer_group(
         self, name: str, body: Union[str, Dict[str, Any]], *, workspace: Optional[str] = None
@@ -1502,9 +1712,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/layergroups/{name}"
         if workspace is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/layergroups/{name}"
+            url = f"{self._rest_url}/workspaces/{workspace}/layergroups/{name}"
+        else:
+            url = f"{self._rest_url}/layergroups/{name}"
 
         self._request(method="put", url=url, body=body)
         return UPDATED_MESSAGE
@@ -1519,9 +1730,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/layergroups/{name}"
         if workspace is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/layergroups/{name}"
+            url = f"{self._rest_url}/workspaces/{workspace}/layergroups/{name}"
+        else:
+            url = f"{self._rest_url}/layergroups/{name}"
 
         self._request(method="delete", url=url)
         return DELETED_MESSAGE
@@ -1534,24 +1746,39 @@ class GeoServer(Base):
     @overload
     def get_layers(self, *, workspace: Optional[str] = None, format: Literal["xml"]) -> str: ...
 
+    @overload
     def get_layers(
-        self, *, workspace: Optional[str] = None, format: Literal["json", "xml"] = "json"
-    ) -> Union[str, Dict[str, Any]]:
+        self,
+        *,
+        workspace: Optional[str] = None,
+        format: Literal["json", "xml"] = "json",
+        stream: Literal[True],
+    ) -> Iterator[bytes]: ...
+
+    def get_layers(
+        self, *, workspace: Optional[str] = None, format: Literal["json", "xml"] = "json", stream: bool = False
+    ) -> Union[str, Dict[str, Any], Iterator[bytes]]:
         """List all layers in the workspace.
 
         Args:
             workspace: Optional. The name of the workspace.
             format: Optional. The format of the response. It can be either "json" or "xml".
+            stream: Optional. When set to `True`, the raw response is returned as an iterator of
+                chunks instead of being parsed, which is useful to forward or stream-parse very
+                large listings. Defaults to False.
 
         Returns:
             The list of all layers in the workspace.
         """
-        url = f"{self.service_url}/rest/layers.{format}"
         if workspace is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/layers.{format}"
+            url = f"{self._rest_url}/workspaces/{workspace}/layers.{format}"
+        else:
+            url = f"{self._rest_url}/layers.{format}"
 
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        if stream:
+            response = self._request(method="get", url=url, stream=True)
+            return response.iter_content(chunk_size=65536)
+        return self._cached_get(url, format=format)
 
     def create_layer(self, body: Union[str, Dict[str, Any]], *, workspace: Optional[str] = None) -> str:
         """Creates a new layer.
@@ -1563,9 +1790,10 @@ class GeoServer(Base):
         Returns:
             The created layer.
         """
-        url = f"{self.service_url}/rest/layers"
         if workspace is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/layers"
+            url = f"{self._rest_url}/workspaces/{workspace}/layers"
+        else:
+            url = f"{self._rest_url}/layers"
 
         self._request(method="post", url=url, body=body)
         return CREATED_MESSAGE
@@ -1609,12 +1837,12 @@ class GeoServer(Base):
         Returns:
             The requested layer.
         """
-        url = f"{self.service_url}/rest/layers/{name}.{format}"
         if workspace is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/layers/{name}.{format}"
+            url = f"{self._rest_url}/workspaces/{workspace}/layers/{name}.{format}"
+        else:
+            url = f"{self._rest_url}/layers/{name}.{format}"
 
-        response = self._request(method="get", url=url, params=dict(quietOnNotFound=quiet_on_not_found))
-        return response.json() if format == "json" else response.text
+        return self._cached_get(url, format=format, params=_QUIET_PARAMS[quiet_on_not_found])
 
     def update_layer(self, name: str, body: Union[str, Dict[str, Any]], *, workspace: Optional[str] = None) -> str:
         """Update an individual layer.
@@ -1627,9 +1855,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/layers/{name}"
         if workspace is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/layers/{name}"
+            url = f"{self._rest_url}/workspaces/{workspace}/layers/{name}"
+        else:
+            url = f"{self._rest_url}/layers/{name}"
 
         self._request(method="put", url=url, body=body)
         return UPDATED_MESSAGE
@@ -1644,9 +1873,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/layers/{name}"
         if workspace is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/layers/{name}"
+            url = f"{self._rest_url}/workspaces/{workspace}/layers/{name}"
+        else:
+            url = f"{self._rest_url}/layers/{name}"
 
         self._request(method="delete", url=url)
         return DELETED_MESSAGE
@@ -1668,9 +1898,8 @@ class GeoServer(Base):
         Returns:
             The logging settings.
         """
-        url = f"{self.service_url}/rest/logging.{format}"
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        url = f"{self._rest_url}/logging.{format}"
+        return self._cached_get(url, format=format)
 
     def update_logging(self, body: Union[str, Dict[str, Any]]) -> str:
         """Modify the logging settings on the server.
@@ -1681,7 +1910,7 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/logging"
+        url = f"{self._rest_url}/logging"
         self._request(method="put", url=url, body=body)
         return UPDATED_MESSAGE
 
@@ -1693,7 +1922,14 @@ class GeoServer(Base):
     @overload
     def get_monitored_requests(self, *, format: Literal["xml"]) -> str: ...
 
-    def get_monitored_requests(self, *, format: Literal["json", "xml"] = "json") -> Union[str, Dict[str, Any]]:
+    @overload
+    def get_monitored_requests(
+        self, *, format: Literal["json", "xml"] = "json", stream: Literal[True]
+    ) -> Iterator[bytes]: ...
+
+    def get_monitored_requests(
+        self, *, format: Literal["json", "xml"] = "json", stream: bool = False
+    ) -> Union[str, Dict[str, Any], Iterator[bytes]]:
         """Returns a list of all requests known to the monitoring system.
         If no list of fields is specified, the full list will be returned,
         with the exception of Class, Body and Error fields.
@@ -1702,13 +1938,18 @@ class GeoServer(Base):
 
         Args:
             format: Optional. The format of the response. It can be either "json" or "xml". Defaults to "json".
+            stream: Optional. When set to `True`, the raw response is returned as an iterator of
+                chunks instead of being parsed, which is useful to forward or stream-parse very
+                large monitoring histories. Defaults to False.
 
         Returns:
             The monitoring requests.
         """
-        url = f"{self.service_url}/rest/monitor/requests.{format}"
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        url = f"{self._rest_url}/monitor/requests.{format}"
+        if stream:
+            response = self._request(method="get", url=url, stream=True)
+            return response.iter_content(chunk_size=65536)
+        return self._cached_get(url, format=format)
 
     def delete_monitored_requests(self) -> str:
         """Removes a request from the monitoring system.
@@ -1716,7 +1957,7 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/monitor/requests"
+        url = f"{self._rest_url}/monitor/requests"
         self._request(method="delete", url=url)
         return OK_MESSAGE
 
@@ -1736,9 +1977,8 @@ class GeoServer(Base):
         Returns:
             The monitoring request.
         """
-        url = f"{self.service_url}/rest/monitor/requests/{id}.{format}"
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        url = f"{self._rest_url}/monitor/requests/{_quote(id)}.{format}"
+        return self._get_formatted(url, format=format)
 
     # Namespaces
 
@@ -1757,9 +1997,8 @@ class GeoServer(Base):
         Returns:
             The list of all namespaces on the server.
         """
-        url = f"{self.service_url}/rest/namespaces.{format}"
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        url = f"{self._rest_url}/namespaces.{format}"
+        return self._cached_get(url, format=format)
 
     def create_namespace(self, body: Union[str, Dict[str, Any]]) -> str:
         """Create a new namespace.
@@ -1770,7 +2009,7 @@ class GeoServer(Base):
         Returns:
             The created namespace.
         """
-        url = f"{self.service_url}/rest/namespaces"
+        url = f"{self._rest_url}/namespaces"
         self._request(method="post", url=url, body=body)
         return CREATED_MESSAGE
 
@@ -1790,9 +2029,8 @@ class GeoServer(Base):
         Returns:
             The requested namespace.
         """
-        url = f"{self.service_url}/rest/namespaces/{name}.{format}"
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        url = f"{self._rest_url}/namespaces/{_quote(name)}.{format}"
+        return self._cached_get(url, format=format)
 
     def update_namespace(self, name: str, body: Union[str, Dict[str, Any]]) -> str:
         """Update an individual namespace.
@@ -1804,7 +2042,7 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/namespaces/{name}"
+        url = f"{self._rest_url}/namespaces/{_quote(name)}"
         self._request(method="put", url=url, body=body)
         return UPDATED_MESSAGE
 
@@ -1817,7 +2055,7 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/namespaces/{name}"
+        url = f"{self._rest_url}/namespaces/{_quote(name)}"
         self._request(method="delete", url=url)
         return DELETED_MESSAGE
 
@@ -1843,12 +2081,12 @@ class GeoServer(Base):
         Returns:
             The WMS settings for the workspace.
         """
-        url = f"{self.service_url}/rest/services/wms/settings.{format}"
         if workspace is not None:
-            url = f"{self.service_url}/rest/services/wms/workspaces/{workspace}/settings.{format}"
+            url = f"{self._rest_url}/services/wms/workspaces/{_quote(workspace)}/settings.{format}"
+        else:
+            url = f"{self._rest_url}/services/wms/settings.{format}"
 
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        return self._cached_get(url, format=format)
 
     def update_wms_settings(self, body: Union[str, Dict[str, Any]], *, workspace: Optional[str] = None) -> str:
         """Update the WMS settings for the workspace.
@@ -1860,9 +2098,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/services/wms/settings"
         if workspace is not None:
-            url = f"{self.service_url}/rest/services/wms/workspaces/{workspace}/settings"
+            url = f"{self._rest_url}/services/wms/workspaces/{_quote(workspace)}/settings"
+        else:
+            url = f"{self._rest_url}/services/wms/settings"
 
         self._request(method="put", url=url, body=body)
         return UPDATED_MESSAGE
@@ -1876,9 +2115,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/services/wms/settings"
         if workspace is not None:
-            url = f"{self.service_url}/rest/services/wms/workspaces/{workspace}/settings"
+            url = f"{self._rest_url}/services/wms/workspaces/{_quote(workspace)}/settings"
+        else:
+            url = f"{self._rest_url}/services/wms/settings"
 
         self._request(method="delete", url=url)
         return DELETED_MESSAGE
@@ -1903,12 +2143,12 @@ class GeoServer(Base):
         Returns:
             The WFS settings for the workspace.
         """
-        url = f"{self.service_url}/rest/services/wfs/settings.{format}"
         if workspace is not None:
-            url = f"{self.service_url}/rest/services/wfs/workspaces/{workspace}/settings.{format}"
+            url = f"{self._rest_url}/services/wfs/workspaces/{_quote(workspace)}/settings.{format}"
+        else:
+            url = f"{self._rest_url}/services/wfs/settings.{format}"
 
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        return self._cached_get(url, format=format)
 
     def update_wfs_settings(self, body: Union[str, Dict[str, Any]], *, workspace: Optional[str] = None) -> str:
         """Update the WFS settings for the workspace.
@@ -1920,9 +2160,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/services/wfs/settings"
         if workspace is not None:
-            url = f"{self.service_url}/rest/services/wfs/workspaces/{workspace}/settings"
+            url = f"{self._rest_url}/services/wfs/workspaces/{_quote(workspace)}/settings"
+        else:
+            url = f"{self._rest_url}/services/wfs/settings"
 
         self._request(method="put", url=url, body=body)
         return UPDATED_MESSAGE
@@ -1936,9 +2177,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/services/wfs/settings"
         if workspace is not None:
-            url = f"{self.service_url}/rest/services/wfs/workspaces/{workspace}/settings"
+            url = f"{self._rest_url}/services/wfs/workspaces/{_quote(workspace)}/settings"
+        else:
+            url = f"{self._rest_url}/services/wfs/settings"
 
         self._request(method="delete", url=url)
         return DELETED_MESSAGE
@@ -1963,12 +2205,12 @@ class GeoServer(Base):
         Returns:
             The WCS settings for the workspace.
         """
-        url = f"{self.service_url}/rest/services/wcs/settings.{format}"
         if workspace is not None:
-            url = f"{self.service_url}/rest/services/wcs/workspaces/{workspace}/settings.{format}"
+            url = f"{self._rest_url}/services/wcs/workspaces/{_quote(workspace)}/settings.{format}"
+        else:
+            url = f"{self._rest_url}/services/wcs/settings.{format}"
 
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        return self._cached_get(url, format=format)
 
     def update_wcs_settings(self, body: Union[str, Dict[str, Any]], *, workspace: Optional[str] = None) -> str:
         """Update the WCS settings for the workspace.
@@ -1980,9 +2222,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/services/wcs/settings"
         if workspace is not None:
-            url = f"{self.service_url}/rest/services/wcs/workspaces/{workspace}/settings"
+            url = f"{self._rest_url}/services/wcs/workspaces/{_quote(workspace)}/settings"
+        else:
+            url = f"{self._rest_url}/services/wcs/settings"
 
         self._request(method="put", url=url, body=body)
         return UPDATED_MESSAGE
@@ -1996,9 +2239,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/services/wcs/settings"
         if workspace is not None:
-            url = f"{self.service_url}/rest/services/wcs/workspaces/{workspace}/settings"
+            url = f"{self._rest_url}/services/wcs/workspaces/{_quote(workspace)}/settings"
+        else:
+            url = f"{self._rest_url}/services/wcs/settings"
 
         self._request(method="delete", url=url)
         return DELETED_MESSAGE
@@ -2023,12 +2267,12 @@ class GeoServer(Base):
         Returns:
             The WMTS settings for the workspace.
         """
-        url = f"{self.service_url}/rest/services/wmts/settings.{format}"
         if workspace is not None:
-            url = f"{self.service_url}/rest/services/wmts/workspaces/{workspace}/settings.{format}"
+            url = f"{self._rest_url}/services/wmts/workspaces/{_quote(workspace)}/settings.{format}"
+        else:
+            url = f"{self._rest_url}/services/wmts/settings.{format}"
 
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        return self._cached_get(url, format=format)
 
     def update_wmts_settings(self, body: Union[str, Dict[str, Any]], *, workspace: Optional[str] = None) -> str:
         """Update the WMTS settings for the workspace.
@@ -2040,9 +2284,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/services/wmts/settings"
         if workspace is not None:
-            url = f"{self.service_url}/rest/services/wmts/workspaces/{workspace}/settings"
+            url = f"{self._rest_url}/services/wmts/workspaces/{_quote(workspace)}/settings"
+        else:
+            url = f"{self._rest_url}/services/wmts/settings"
 
         self._request(method="put", url=url, body=body)
         return UPDATED_MESSAGE
@@ -2056,9 +2301,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/services/wmts/settings"
         if workspace is not None:
-            url = f"{self.service_url}/rest/services/wmts/workspaces/{workspace}/settings"
+            url = f"{self._rest_url}/services/wmts/workspaces/{_quote(workspace)}/settings"
+        else:
+            url = f"{self._rest_url}/services/wmts/settings"
 
         self._request(method="delete", url=url)
         return DELETED_MESSAGE
@@ -2078,9 +2324,8 @@ class GeoServer(Base):
         Returns:
             The OSEO settings for the workspace.
         """
-        url = f"{self.service_url}/rest/services/oseo/settings.{format}"
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        url = f"{self._rest_url}/services/oseo/settings.{format}"
+        return self._cached_get(url, format=format)
 
     def update_oseo_settings(self, body: Union[str, Dict[str, Any]]) -> str:
         """Update the Open Search for Earth Observation Service settings globally for the server.
@@ -2091,7 +2336,7 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/services/oseo/settings"
+        url = f"{self._rest_url}/services/oseo/settings"
         self._request(method="put", url=url, body=body)
         return UPDATED_MESSAGE
 
@@ -2107,7 +2352,7 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/reset"
+        url = f"{self._rest_url}/reset"
         self._request(method="put", url=url)
         return OK_MESSAGE
 
@@ -2119,7 +2364,7 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/reload"
+        url = f"{self._rest_url}/reload"
         self._request(method="put", url=url)
         return OK_MESSAGE
 
@@ -2159,10 +2404,8 @@ class GeoServer(Base):
             geoserver.get_resource(resource="styles/default_point.sld", operation="default")
             ```
         """
-        url = f"{self.service_url}/rest/resources/{path}.{format}"
-        params = dict(operation=operation, format="json")
-        response = self._request(method="get", url=url, params=params)
-        return response.json() if format == "json" else response.text
+        url = f"{self._rest_url}/resources/{quote(path, safe='/')}.{format}"
+        return self._cached_get(url, format=format, params=_RESOURCE_PARAMS[operation])
 
     def update_resource(self, path: str, body: Union[str, Dict[str, Any]]) -> str:
         """Upload/move/copy a resource, create directories on the fly (overwrite if exists). For move/copy operations, place source path in body. Copying is not supported for directories.
@@ -2175,7 +2418,7 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/resources/{path}"
+        url = f"{self._rest_url}/resources/{quote(path, safe='/')}"
         self._request(method="put", url=url, body=body)
         return UPDATED_MESSAGE
 
@@ -2188,7 +2431,7 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/resources/{path}"
+        url = f"{self._rest_url}/resources/{quote(path, safe='/')}"
         self._request(method="delete", url=url)
         return DELETED_MESSAGE
 
@@ -2201,9 +2444,8 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/resources/{path}"
-        response = self._request(method="head", url=url, ignore=[404])
-        return response.status_code == 200
+        url = f"{self._rest_url}/resources/{quote(path, safe='/')}"
+        return self._cached_exists(url)
 
     # Security
 
@@ -2222,9 +2464,8 @@ class GeoServer(Base):
         Returns:
             The master password.
         """
-        url = f"{self.service_url}/rest/security/masterpw.{format}"
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        url = f"{self._rest_url}/security/masterpw.{format}"
+        return self._get_formatted(url, format=format)
 
     def update_master_password(self, body: Union[str, Dict[str, Any]]) -> str:
         """Changes keystore password. Must supply current keystore password. HTTPS is strongly suggested, otherwise password will be sent in plain text.
@@ -2235,7 +2476,7 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/security/masterpw"
+        url = f"{self._rest_url}/security/masterpw"
         self._request(method="put", url=url, body=body)
         return UPDATED_MESSAGE
 
@@ -2248,7 +2489,7 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/security/self/password"
+        url = f"{self._rest_url}/security/self/password"
         self._request(method="put", url=url, body=body)
         return UPDATED_MESSAGE
 
@@ -2268,9 +2509,8 @@ class GeoServer(Base):
         Returns:
             The catalog mode.
         """
-        url = f"{self.service_url}/rest/security/acl/catalog.{format}"
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        url = f"{self._rest_url}/security/acl/catalog.{format}"
+        return self._cached_get(url, format=format)
 
     def update_catalog_mode(self, body: Union[str, Dict[str, Any]]) -> str:
         """Changes catalog mode. The mode must be one of HIDE, MIXED, or CHALLENGE.
@@ -2281,7 +2521,7 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/security/acl/catalog"
+        url = f"{self._rest_url}/security/acl/catalog"
         self._request(method="put", url=url, body=body)
         return UPDATED_MESSAGE
 
@@ -2300,9 +2540,8 @@ class GeoServer(Base):
         Returns:
             The security layers.
         """
-        url = f"{self.service_url}/rest/security/acl/layers.{format}"
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        url = f"{self._rest_url}/security/acl/layers.{format}"
+        return self._cached_get(url, format=format)
 
     def security_layer_exists(self, rule: str) -> bool:
         """Check if a security layer exists.
@@ -2313,9 +2552,8 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/security/acl/layers/{rule}"
-        response = self._request(method="head", url=url, ignore=[404, 405])
-        return response.status_code == 200
+        url = f"{self._rest_url}/security/acl/layers/{rule}"
+        return self._cached_exists(url, ignore=[404, 405])
 
     def create_security_layers(self, body: Union[str, Dict[str, Any]]) -> str:
         """Adds one or more new layer-based rules to the list of security rules.
@@ -2326,7 +2564,7 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/security/acl/layers"
+        url = f"{self._rest_url}/security/acl/layers"
         self._request(method="post", url=url, body=body)
         return CREATED_MESSAGE
 
@@ -2339,7 +2577,7 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/security/acl/layers"
+        url = f"{self._rest_url}/security/acl/layers"
         self._request(method="put", url=url, body=body)
         return UPDATED_MESSAGE
 
@@ -2353,9 +2591,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/security/acl/layers"
         if rule is not None:
-            url = f"{self.service_url}/rest/security/acl/layers/{rule}"
+            url = f"{self._rest_url}/security/acl/layers/{rule}"
+        else:
+            url = f"{self._rest_url}/security/acl/layers"
 
         self._request(method="delete", url=url)
         return DELETED_MESSAGE
@@ -2380,12 +2619,12 @@ class GeoServer(Base):
         Returns:
             The security services.
         """
-        url = f"{self.service_url}/rest/security/acl/services.{format}"
         if rule is not None:
-            url = f"{self.service_url}/rest/security/acl/services/{rule}.{format}"
+            url = f"{self._rest_url}/security/acl/services/{rule}.{format}"
+        else:
+            url = f"{self._rest_url}/security/acl/services.{format}"
 
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        return self._cached_get(url, format=format)
 
     def update_security_services(self, body: Union[str, Dict[str, Any]], *, rule: Optional[str] = None) -> str:
         """Adds one or more new service-based rules to the list of security rules.
@@ -2397,9 +2636,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/security/acl/services"
         if rule is not None:
-            url = f"{self.service_url}/rest/security/acl/services/{rule}"
+            url = f"{self._rest_url}/security/acl/services/{rule}"
+        else:
+            url = f"{self._rest_url}/security/acl/services"
 
         self._request(method="post", url=url, body=body)
         return UPDATED_MESSAGE
@@ -2413,9 +2653,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/security/acl/services"
         if rule is not None:
-            url = f"{self.service_url}/rest/security/acl/services/{rule}"
+            url = f"{self._rest_url}/security/acl/services/{rule}"
+        else:
+            url = f"{self._rest_url}/security/acl/services"
 
         self._request(method="delete", url=url)
         return DELETED_MESSAGE
@@ -2440,12 +2681,12 @@ class GeoServer(Base):
         Returns:
             The security REST.
         """
-        url = f"{self.service_url}/rest/security/acl/rest.{format}"
         if rule is not None:
-            url = f"{self.service_url}/rest/security/acl/{rule}.{format}"
+            url = f"{self._rest_url}/security/acl/{rule}.{format}"
+        else:
+            url = f"{self._rest_url}/security/acl/rest.{format}"
 
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        return self._cached_get(url, format=format)
 
     def create_security_access(self, body: Union[str, Dict[str, Any]], *, rule: Optional[str] = None) -> str:
         """Adds one or more new REST access rules.
@@ -2457,9 +2698,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/security/acl/rest"
         if rule is not None:
-            url = f"{self.service_url}/rest/security/acl/{rule}"
+            url = f"{self._rest_url}/security/acl/{rule}"
+        else:
+            url = f"{self._rest_url}/security/acl/rest"
 
         self._request(method="post", url=url, body=body)
         return CREATED_MESSAGE
@@ -2474,9 +2716,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/security/acl/rest"
         if rule is not None:
-            url = f"{self.service_url}/rest/security/acl/{rule}"
+            url = f"{self._rest_url}/security/acl/{rule}"
+        else:
+            url = f"{self._rest_url}/security/acl/rest"
 
         self._request(method="put", url=url, body=body)
         return UPDATED_MESSAGE
@@ -2491,9 +2734,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/security/acl/rest"
         if rule is not None:
-            url = f"{self.service_url}/rest/security/acl/{rule}"
+            url = f"{self._rest_url}/security/acl/{rule}"
+        else:
+            url = f"{self._rest_url}/security/acl/rest"
 
         self._request(method="delete", url=url, body=body)
         return DELETED_MESSAGE
@@ -2518,12 +2762,12 @@ class GeoServer(Base):
         Returns:
             The settings for the workspace.
         """
-        url = f"{self.service_url}/rest/settings.{format}"
         if workspace is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/settings.{format}"
+            url = f"{self._rest_url}/workspaces/{workspace}/settings.{format}"
+        else:
+            url = f"{self._rest_url}/settings.{format}"
 
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        return self._cached_get(url, format=format)
 
     def update_settings(self, body: Union[str, Dict[str, Any]], *, workspace: Optional[str] = None) -> str:
         """Updates global or workspace settings on the server.
@@ -2535,9 +2779,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/settings"
         if workspace is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/settings"
+            url = f"{self._rest_url}/workspaces/{workspace}/settings"
+        else:
+            url = f"{self._rest_url}/settings"
 
         self._request(method="put", url=url, body=body)
         return UPDATED_MESSAGE
@@ -2551,7 +2796,7 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/settings"
+        url = f"{self._rest_url}/workspaces/{workspace}/settings"
         response = self._request(method="delete", url=url)
         return response.text
 
@@ -2565,9 +2810,8 @@ class GeoServer(Base):
         Returns:
             The contact settings.
         """
-        url = f"{self.service_url}/rest/settings/contact.{format}"
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        url = f"{self._rest_url}/settings/contact.{format}"
+        return self._cached_get(url, format=format)
 
     def update_contact_settings(self) -> str:
         """Updates global contact settings on the server.
@@ -2575,7 +2819,7 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/settings/contact"
+        url = f"{self._rest_url}/settings/contact"
         self._request(method="put", url=url)
         return UPDATED_MESSAGE
 
@@ -2589,9 +2833,28 @@ class GeoServer(Base):
     @overload
     def get_coverage_granules(self, name: str, *, workspace: str, store: str, format: Literal["xml"]) -> str: ...
 
+    @overload
     def get_coverage_granules(
-        self, name: str, *, workspace: str, store: str, limit: int = -1, format: Literal["json", "xml"] = "json"
-    ) -> Union[str, Dict[str, Any]]:
+        self,
+        name: str,
+        *,
+        workspace: str,
+        store: str,
+        limit: int = -1,
+        format: Literal["json", "xml"] = "json",
+        stream: Literal[True],
+    ) -> Iterator[bytes]: ...
+
+    def get_coverage_granules(
+        self,
+        name: str,
+        *,
+        workspace: str,
+        store: str,
+        limit: int = -1,
+        format: Literal["json", "xml"] = "json",
+        stream: bool = False,
+    ) -> Union[str, Dict[str, Any], Iterator[bytes]]:
         """Displays a list of all the attributes associated to a particular coverage's granules
 
         Args:
@@ -2599,14 +2862,19 @@ class GeoServer(Base):
             workspace: The name of the workspace containing the coverage stores.
             store: The name of the store.
             format: Optional. The format of the response. It can be either "json" or "xml". Defaults to "json".
+            stream: Optional. When set to `True`, the raw response is returned as an iterator of
+                chunks instead of being parsed, which is useful to forward or stream-parse indexes
+                with tens of thousands of granules. Defaults to False.
 
         Returns:
             The granules in the structured coverage store.
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/coveragestores/{store}/coverages/{name}/index/granules.{format}"
+        url = f"{self._rest_url}/workspaces/{workspace}/coveragestores/{store}/coverages/{name}/index/granules.{format}"
         params = dict(limit=limit) if limit >= 0 else {}
-        response = self._request(method="get", url=url, params=params)
-        return response.json() if format == "json" else response.text
+        if stream:
+            response = self._request(method="get", url=url, params=params, stream=True)
+            return response.iter_content(chunk_size=65536)
+        return self._cached_get(url, format=format, params=params)
 
     def delete_coverage_granules(
         self,
@@ -2635,7 +2903,7 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/coveragestores/{store}/coverages/{name}/index/granules"
+        url = f"{self._rest_url}/workspaces/{workspace}/coveragestores/{store}/coverages/{name}/index/granules"
         params = dict(filter=filter, purge=purge, updateBBox=update_bbox)
         self._request(method="delete", url=url, params=params)
         return DELETED_MESSAGE
@@ -2665,9 +2933,8 @@ class GeoServer(Base):
         Returns:
             The granule in the structured coverage store.
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/coveragestores/{store}/coverages/{coverage}/granules/index/{name}.{format}"
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        url = f"{self._rest_url}/workspaces/{workspace}/coveragestores/{store}/coverages/{coverage}/granules/index/{name}.{format}"
+        return self._cached_get(url, format=format)
 
     def delete_coverage_granule(
         self, name: str, *, workspace: str, store: str, coverage: str, purge: bool = False, update_bbox: bool = False
@@ -2689,7 +2956,9 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/coveragestores/{store}/coverages/{coverage}/granules/index/{name}"
+        url = (
+            f"{self._rest_url}/workspaces/{workspace}/coveragestores/{store}/coverages/{coverage}/granules/index/{name}"
+        )
         params = dict(purge=purge, updateBBox=update_bbox)
         self._request(method="delete", url=url, params=params)
         return DELETED_MESSAGE
@@ -2702,24 +2971,39 @@ class GeoServer(Base):
     @overload
     def get_styles(self, *, workspace: Optional[str] = None, format: Literal["xml"]) -> str: ...
 
+    @overload
     def get_styles(
-        self, *, workspace: Optional[str] = None, format: Literal["json", "xml"] = "json"
-    ) -> Union[str, Dict[str, Any]]:
+        self,
+        *,
+        workspace: Optional[str] = None,
+        format: Literal["json", "xml"] = "json",
+        stream: Literal[True],
+    ) -> Iterator[bytes]: ...
+
+    def get_styles(
+        self, *, workspace: Optional[str] = None, format: Literal["json", "xml"] = "json", stream: bool = False
+    ) -> Union[str, Dict[str, Any], Iterator[bytes]]:
         """Displays a list of all styles on the server.
 
         Args:
             workspace: Optional. The name of the workspace.
             format: Optional. The format of the response. It can be either "json" or "xml". Defaults to "json".
+            stream: Optional. When set to `True`, the raw response is returned as an iterator of
+                chunks instead of being parsed, which is useful to forward or stream-parse very
+                large listings. Defaults to False.
 
         Returns:
             The styles.
         """
-        url = f"{self.service_url}/rest/styles.{format}"
         if workspace is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/styles.{format}"
+            url = f"{self._rest_url}/workspaces/{workspace}/styles.{format}"
+        else:
+            url = f"{self._rest_url}/styles.{format}"
 
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        if stream:
+            response = self._request(method="get", url=url, stream=True)
+            return response.iter_content(chunk_size=65536)
+        return self._cached_get(url, format=format)
 
     def style_exists(self, name: str, *, workspace: Optional[str] = None) -> bool:
         """Check if a style exists.
@@ -2731,12 +3015,23 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/styles/{name}.xml"
+        # A fresh cached style listing answers membership without any round-trip, which covers
+        # the common "list styles, then check before upload" sequence.
         if workspace is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/styles/{name}.xml"
+            listing = self._cached_value(f"{self._rest_url}/workspaces/{workspace}/styles.json")
+        else:
+            listing = self._cached_value(f"{self._rest_url}/styles.json")
+        if isinstance(listing, dict):
+            styles = listing.get("styles")
+            if isinstance(styles, dict) and isinstance(styles.get("style"), list):
+                return any(style.get("name") == name for style in styles["style"])
 
-        response = self._request(method="head", url=url, ignore=[404])
-        return response.status_code == 200
+        if workspace is not None:
+            url = f"{self._rest_url}/workspaces/{workspace}/styles/{name}.xml"
+        else:
+            url = f"{self._rest_url}/styles/{name}.xml"
+
+        return self._cached_exists(url)
 
     @overload
     def get_style(
@@ -2759,12 +3054,12 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/styles/{name}.{format}"
         if workspace is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/styles/{name}.{format}"
+            url = f"{self._rest_url}/workspaces/{workspace}/styles/{name}.{format}"
+        else:
+            url = f"{self._rest_url}/styles/{name}.{format}"
 
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        return self._cached_get(url, format=format)
 
     def create_style(self, body: str, *, workspace: Optional[str] = None) -> str:
         """Creates a new style.
@@ -2784,9 +3079,10 @@ class GeoServer(Base):
             geoserver.create_style(body="<sld>...</sld>")
             ```
         """
-        url = f"{self.service_url}/rest/styles"
         if workspace is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/styles"
+            url = f"{self._rest_url}/workspaces/{workspace}/styles"
+        else:
+            url = f"{self._rest_url}/styles"
 
         self._request(method="post", url=url, body=body)
         return CREATED_MESSAGE
@@ -2865,11 +3161,11 @@ class GeoServer(Base):
             raise ValueError("The `style` argument must be provided when overwrite is `True`")
 
         # Upload from a zip file
-        if zipfile.is_zipfile(file):
+        if is_zip(file):
             headers = {"Content-Type": "application/zip"}
-            url = f"{self.service_url}/rest/styles"
+            url = f"{self._rest_url}/styles"
             if overwrite:
-                url = f"{self.service_url}/rest/styles/{name}.zip"
+                url = f"{self._rest_url}/styles/{name}.zip"
 
             _ = self._request(method=method, url=url, file=file, headers=headers)
             return CREATED_MESSAGE
@@ -2884,8 +3180,24 @@ class GeoServer(Base):
             body = f"<style><name>{name}</name><filename>{name}.sld</filename></style>"
             _ = self.create_style(body=body, workspace=workspace)
 
-        body = file.read().decode("utf-8") if isinstance(file, BufferedReader) else Path(file).read_text()
-        _ = self.update_style(name=name, body=body, workspace=workspace)
+        # The SLD version always sits in the document head, so only that much is read to pick the
+        # content type; the body itself is streamed from disk instead of being materialized as a
+        # Python string and re-encoded by requests.
+        if isinstance(file, BufferedReader):
+            head = file.read(8192)
+            file.seek(0)
+        else:
+            with open(file, "rb") as reader:
+                head = reader.read(8192)
+
+        content_type = _sld_content_type(head.decode("utf-8", errors="ignore"))
+
+        if workspace is not None:
+            url = f"{self._rest_url}/workspaces/{workspace}/styles/{name}"
+        else:
+            url = f"{self._rest_url}/styles/{name}"
+
+        self._request(method="put", url=url, file=file, headers={"Content-Type": content_type})
         return CREATED_MESSAGE
 
     def update_style(self, name: str, body: str, *, workspace: Optional[str] = None) -> str:
@@ -2902,21 +3214,13 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/styles/{name}"
         if workspace is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/styles/{name}"
+            url = f"{self._rest_url}/workspaces/{workspace}/styles/{name}"
+        else:
+            url = f"{self._rest_url}/styles/{name}"
 
         # Automatically determine the content type based on the SLD version
-        pattern = r'StyledLayerDescriptor[^>]*version="([^"]*)"'
-        match = re.search(pattern, body)
-        if not match:
-            raise ValueError("The SLD version could not be determined.")
-
-        sld_version = match.group(1)
-
-        content_type = "application/vnd.ogc.sld+xml"
-        if sld_version == "1.1.0" or sld_version == "1.1":
-            content_type = "application/vnd.ogc.se+xml"
+        content_type = _sld_content_type(body)
 
         self._request(method="put", url=url, body=body, headers={"Content-Type": content_type})
         return UPDATED_MESSAGE
@@ -2931,9 +3235,10 @@ class GeoServer(Base):
         Returns:
             The style content.
         """
-        url = f"{self.service_url}/rest/styles/{name}.sld"
         if workspace is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/styles/{name}.sld"
+            url = f"{self._rest_url}/workspaces/{workspace}/styles/{name}.sld"
+        else:
+            url = f"{self._rest_url}/styles/{name}.sld"
 
         response = self._request(method="get", url=url)
         return response.text
@@ -2962,9 +3267,10 @@ class GeoServer(Base):
             ```
 
         """
-        url = f"{self.service_url}/rest/layers/{layer}"
         if workspace is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/layers/{layer}"
+            url = f"{self._rest_url}/workspaces/{workspace}/layers/{layer}"
+        else:
+            url = f"{self._rest_url}/layers/{layer}"
 
         body = f"<layer><defaultStyle><name>{style}</name></defaultStyle></layer>"
         self._request(method="put", url=url, body=body)
@@ -2984,9 +3290,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/styles/{name}"
         if workspace is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/styles/{name}"
+            url = f"{self._rest_url}/workspaces/{workspace}/styles/{name}"
+        else:
+            url = f"{self._rest_url}/styles/{name}"
 
         params = dict(purge=purge, recurse=recurse)
         self._request(method="delete", url=url, params=params)
@@ -3018,16 +3325,15 @@ class GeoServer(Base):
             The templates.
         """
         if workspace is None and store is None:
-            url = f"{self.service_url}/rest/templates.{format}"
+            url = f"{self._rest_url}/templates.{format}"
         elif workspace is not None and store is None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/templates.{format}"
+            url = f"{self._rest_url}/workspaces/{workspace}/templates.{format}"
         elif workspace is not None and store is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/datastores/{store}/templates.{format}"
+            url = f"{self._rest_url}/workspaces/{workspace}/datastores/{store}/templates.{format}"
         else:
             raise ValueError("A workspace must be provided if a store is provided.")
 
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        return self._cached_get(url, format=format)
 
     def get_template(
         self,
@@ -3050,63 +3356,32 @@ class GeoServer(Base):
             coverage: Optional. The name of the coverage.
 
         Returns:
-            The templates.
+            The raw Freemarker (`.ftl`) template body as text.
         """
-        if (
-            workspace is None
-            and data_store is None
-            and feature_type is None
-            and coverage_store is None
-            and coverage is None
-        ):
-            url = f"{self.service_url}/rest/templates/{name}.ftl"
-        if (
-            workspace is not None
-            and data_store is None
-            and feature_type is None
-            and coverage_store is None
-            and coverage is None
-        ):
-            url = f"{self.service_url}/rest/workspaces/{workspace}/templates/{name}.ftl"
-        elif (
-            workspace is not None
-            and data_store is not None
-            and feature_type is None
-            and coverage_store is None
-            and coverage is None
-        ):
-            url = f"{self.service_url}/rest/workspaces/{workspace}/datastores/{data_store}/templates/{name}.ftl"
-        elif (
-            workspace is not None
-            and data_store is not None
-            and feature_type is not None
-            and coverage_store is None
-            and coverage is None
-        ):
-            url = f"{self.service_url}/rest/workspaces/{workspace}/datastores/{data_store}/featuretypes/{feature_type}/templates/{name}.ftl"
-        elif (
-            workspace is not None
-            and data_store is None
-            and feature_type is None
-            and coverage_store is not None
-            and coverage is None
-        ):
-            url = f"{self.service_url}/rest/workspaces/{workspace}/coveragestores/{coverage_store}/templates/{name}.ftl"
-        elif (
-            workspace is not None
-            and data_store is None
-            and feature_type is None
-            and coverage_store is not None
-            and coverage is not None
-        ):
-            url = f"{self.service_url}/rest/workspaces/{workspace}/coveragestores/{coverage_store}/coverages/{coverage}/templates/{name}.ftl"
-        else:
+        template = _TEMPLATE_URLS.get(
+            (
+                workspace is not None,
+                data_store is not None,
+                feature_type is not None,
+                coverage_store is not None,
+                coverage is not None,
+            )
+        )
+        if template is None:
             raise ValueError(
                 f"Invalid combinations of workspace, store, and featuretype. Got {workspace}, {data_store}, and {feature_type}."
             )
+        url = self._rest_url + template.format(
+            name=name,
+            workspace=workspace,
+            data_store=data_store,
+            feature_type=feature_type,
+            coverage_store=coverage_store,
+            coverage=coverage,
+        )
 
         response = self._request(method="get", url=url)
-        return response.json()
+        return response.text
 
     def create_template(
         self,
@@ -3134,58 +3409,27 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        if (
-            workspace is None
-            and data_store is None
-            and feature_type is None
-            and coverage_store is None
-            and coverage is None
-        ):
-            url = f"{self.service_url}/rest/templates/{name}.ftl"
-        if (
-            workspace is not None
-            and data_store is None
-            and feature_type is None
-            and coverage_store is None
-            and coverage is None
-        ):
-            url = f"{self.service_url}/rest/workspaces/{workspace}/templates/{name}.ftl"
-        elif (
-            workspace is not None
-            and data_store is not None
-            and feature_type is None
-            and coverage_store is None
-            and coverage is None
-        ):
-            url = f"{self.service_url}/rest/workspaces/{workspace}/datastores/{data_store}/templates/{name}.ftl"
-        elif (
-            workspace is not None
-            and data_store is not None
-            and feature_type is not None
-            and coverage_store is None
-            and coverage is None
-        ):
-            url = f"{self.service_url}/rest/workspaces/{workspace}/datastores/{data_store}/featuretypes/{feature_type}/templates/{name}.ftl"
-        elif (
-            workspace is not None
-            and data_store is None
-            and feature_type is None
-            and coverage_store is not None
-            and coverage is None
-        ):
-            url = f"{self.service_url}/rest/workspaces/{workspace}/coveragestores/{coverage_store}/templates/{name}.ftl"
-        elif (
-            workspace is not None
-            and data_store is None
-            and feature_type is None
-            and coverage_store is not None
-            and coverage is not None
-        ):
-            url = f"{self.service_url}/rest/workspaces/{workspace}/coveragestores/{coverage_store}/coverages/{coverage}/templates/{name}.ftl"
-        else:
+        template = _TEMPLATE_URLS.get(
+            (
+                workspace is not None,
+                data_store is not None,
+                feature_type is not None,
+                coverage_store is not None,
+                coverage is not None,
+            )
+        )
+        if template is None:
             raise ValueError(
                 f"Invalid combinations of workspace, store, and featuretype. Got {workspace}, {data_store}, and {feature_type}."
             )
+        url = self._rest_url + template.format(
+            name=name,
+            workspace=workspace,
+            data_store=data_store,
+            feature_type=feature_type,
+            coverage_store=coverage_store,
+            coverage=coverage,
+        )
 
         headers = {"Content-Type": "text/plain"}
         self._request(method="put", url=url, body=body, headers=headers)
@@ -3214,58 +3458,27 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        if (
-            workspace is None
-            and data_store is None
-            and feature_type is None
-            and coverage_store is None
-            and coverage is None
-        ):
-            url = f"{self.service_url}/rest/templates/{name}.ftl"
-        if (
-            workspace is not None
-            and data_store is None
-            and feature_type is None
-            and coverage_store is None
-            and coverage is None
-        ):
-            url = f"{self.service_url}/rest/workspaces/{workspace}/templates/{name}.ftl"
-        elif (
-            workspace is not None
-            and data_store is not None
-            and feature_type is None
-            and coverage_store is None
-            and coverage is None
-        ):
-            url = f"{self.service_url}/rest/workspaces/{workspace}/datastores/{data_store}/templates/{name}.ftl"
-        elif (
-            workspace is not None
-            and data_store is not None
-            and feature_type is not None
-            and coverage_store is None
-            and coverage is None
-        ):
-            url = f"{self.service_url}/rest/workspaces/{workspace}/datastores/{data_store}/featuretypes/{feature_type}/templates/{name}.ftl"
-        elif (
-            workspace is not None
-            and data_store is None
-            and feature_type is None
-            and coverage_store is not None
-            and coverage is None
-        ):
-            url = f"{self.service_url}/rest/workspaces/{workspace}/coveragestores/{coverage_store}/templates/{name}.ftl"
-        elif (
-            workspace is not None
-            and data_store is None
-            and feature_type is None
-            and coverage_store is not None
-            and coverage is not None
-        ):
-            url = f"{self.service_url}/rest/workspaces/{workspace}/coveragestores/{coverage_store}/coverages/{coverage}/templates/{name}.ftl"
-        else:
+        template = _TEMPLATE_URLS.get(
+            (
+                workspace is not None,
+                data_store is not None,
+                feature_type is not None,
+                coverage_store is not None,
+                coverage is not None,
+            )
+        )
+        if template is None:
             raise ValueError(
                 f"Invalid combinations of workspace, store, and featuretype. Got {workspace}, {data_store}, and {feature_type}."
             )
+        url = self._rest_url + template.format(
+            name=name,
+            workspace=workspace,
+            data_store=data_store,
+            feature_type=feature_type,
+            coverage_store=coverage_store,
+            coverage=coverage,
+        )
 
         self._request(method="delete", url=url)
         return DELETED_MESSAGE
@@ -3294,9 +3507,8 @@ class GeoServer(Base):
             geoserver.get_transforms()
             ```
         """
-        url = f"{self.service_url}/rest/services/wfs/transforms.{format}"
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        url = f"{self._rest_url}/services/wfs/transforms.{format}"
+        return self._get_formatted(url, format=format)
 
     def create_wfs_transform(
         self,
@@ -3336,7 +3548,7 @@ class GeoServer(Base):
             geoserver.create_transform(body)
             ```
         """
-        url = f"{self.service_url}/rest/services/wfs/transforms"
+        url = f"{self._rest_url}/services/wfs/transforms"
         params = dict(
             sourceFormat=source_format,
             outputFormat=output_format,
@@ -3369,9 +3581,8 @@ class GeoServer(Base):
             geoserver.get_transform(transform="test1")
             ```
         """
-        url = f"{self.service_url}/rest/services/wfs/transforms/{name}.{format}"
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        url = f"{self._rest_url}/services/wfs/transforms/{name}.{format}"
+        return self._get_formatted(url, format=format)
 
     def update_wfs_transform(self, name: str, body: Union[str, Dict[str, Any]]) -> str:
         """Modifies a single transform.
@@ -3399,7 +3610,7 @@ class GeoServer(Base):
             geoserver.update_transform(transform="test1", body=body)
             ```
         """
-        url = f"{self.service_url}/rest/services/wfs/transforms/{name}"
+        url = f"{self._rest_url}/services/wfs/transforms/{name}"
         self._request(method="put", url=url, body=body)
         return UPDATED_MESSAGE
 
@@ -3419,7 +3630,7 @@ class GeoServer(Base):
             geoserver.delete_transform(transform="test1")
             ```
         """
-        url = f"{self.service_url}/rest/services/wfs/transforms/{name}"
+        url = f"{self._rest_url}/services/wfs/transforms/{name}"
         self._request(method="delete", url=url)
         return DELETED_MESSAGE
 
@@ -3445,6 +3656,7 @@ class GeoServer(Base):
         format: Literal["xml"],
     ) -> str: ...
 
+    @overload
     def get_wms_layers(
         self,
         *,
@@ -3452,7 +3664,18 @@ class GeoServer(Base):
         store: Optional[str] = None,
         list: Optional[Literal["available"]] = None,
         format: Literal["json", "xml"] = "json",
-    ) -> Union[str, Dict[str, Any]]:
+        stream: Literal[True],
+    ) -> Iterator[bytes]: ...
+
+    def get_wms_layers(
+        self,
+        *,
+        workspace: str,
+        store: Optional[str] = None,
+        list: Optional[Literal["available"]] = None,
+        format: Literal["json", "xml"] = "json",
+        stream: bool = False,
+    ) -> Union[str, Dict[str, Any], Iterator[bytes]]:
         """Retrieves the WMS layers available on the server.
 
         Args:
@@ -3460,17 +3683,58 @@ class GeoServer(Base):
             store: Optional. Name of the wms store.
             list: Optional. Set `list=available` to see all possible layers in the store, not just ones currently published.
             format: Optional. The format of the response. It can be either "json" or "xml". Defaults to "json".
+            stream: Optional. When set to `True`, the raw response is returned as an iterator of
+                chunks instead of being loaded in memory, which is useful to feed large catalogs
+                into a streaming parser. Defaults to False.
 
         Returns:
             The WMS layers.
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/wmslayers.{format}"
         if store is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/wmsstores/{store}/wmslayers.{format}"
+            url = f"{self._rest_url}/workspaces/{workspace}/wmsstores/{store}/wmslayers.{format}"
+        else:
+            url = f"{self._rest_url}/workspaces/{workspace}/wmslayers.{format}"
 
         params = dict(list=list)
-        response = self._request(method="get", url=url, params=params)
-        return response.json() if format == "json" else response.text
+        if stream:
+            response = self._request(method="get", url=url, params=params, stream=True)
+            return response.iter_content(chunk_size=65536)
+        return self._cached_get(url, format=format, params=params)
+
+    def get_wms_layer_names(
+        self,
+        *,
+        workspace: str,
+        store: Optional[str] = None,
+        list: Optional[Literal["available"]] = None,
+    ) -> List[str]:
+        """Shortcut to retrieve only the names of the WMS layers available on the server.
+
+        The listing is fetched and parsed once; use this instead of `get_wms_layers` when only the
+        layer names are needed, e.g. to drive existence checks or bulk operations.
+
+        Args:
+            workspace: The name of the workspace.
+            store: Optional. Name of the wms store.
+            list: Optional. Set `list=available` to see all possible layers in the store, not just ones currently published.
+
+        Returns:
+            The names of the WMS layers.
+        """
+        data = self.get_wms_layers(workspace=workspace, store=store, list=list)
+        if list == "available":
+            # Available (unpublished) layers are serialized as plain strings under "list".
+            listing = data.get("list") or {}
+            names = listing.get("string", []) if isinstance(listing, dict) else []
+            if isinstance(names, str):
+                names = [names]
+            return names
+        layers = data.get("wmsLayers") or {}
+        items = layers.get("wmsLayer", []) if isinstance(layers, dict) else []
+        # A single layer is serialized as a bare dict instead of a one-element list.
+        if isinstance(items, dict):
+            items = [items]
+        return [item["name"] for item in items]
 
     def create_wms_layer(self, body: Union[str, Dict[str, Any]], *, workspace: str, store: Optional[str] = None) -> str:
         """Creates a new WMS layer.
@@ -3483,9 +3747,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/wmslayers"
         if store is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/wmsstores/{store}/wmslayers"
+            url = f"{self._rest_url}/workspaces/{workspace}/wmsstores/{store}/wmslayers"
+        else:
+            url = f"{self._rest_url}/workspaces/{workspace}/wmslayers"
 
         self._request(method="post", url=url, body=body)
         return CREATED_MESSAGE
@@ -3534,13 +3799,13 @@ class GeoServer(Base):
         Returns:
             The WMS layer.
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/wmslayers/{name}.{format}"
         if store is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/wmsstores/{store}/wmslayers/{name}.{format}"
+            url = f"{self._rest_url}/workspaces/{workspace}/wmsstores/{store}/wmslayers/{name}.{format}"
+        else:
+            url = f"{self._rest_url}/workspaces/{workspace}/wmslayers/{name}.{format}"
 
-        params = dict(quietOnNotFound=quiet_on_not_found)
-        response = self._request(method="get", url=url, params=params)
-        return response.json() if format == "json" else response.text
+        params = _QUIET_PARAMS[quiet_on_not_found]
+        return self._get_formatted(url, format=format, params=params)
 
     def update_wms_layer(
         self,
@@ -3575,9 +3840,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/wmslayers/{name}"
         if store is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/wmsstores/{store}/wmslayers/{name}"
+            url = f"{self._rest_url}/workspaces/{workspace}/wmsstores/{store}/wmslayers/{name}"
+        else:
+            url = f"{self._rest_url}/workspaces/{workspace}/wmslayers/{name}"
 
         params = dict(calculate=calculate)
         self._request(method="put", url=url, body=body, params=params)
@@ -3595,9 +3861,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/wmslayers/{name}"
         if store is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/wmsstores/{store}/wmslayers/{name}"
+            url = f"{self._rest_url}/workspaces/{workspace}/wmsstores/{store}/wmslayers/{name}"
+        else:
+            url = f"{self._rest_url}/workspaces/{workspace}/wmslayers/{name}"
 
         params = dict(recurse=recurse)
         self._request(method="delete", url=url, params=params)
@@ -3621,9 +3888,8 @@ class GeoServer(Base):
         Returns:
             The WMS stores.
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/wmsstores.{format}"
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        url = f"{self._rest_url}/workspaces/{workspace}/wmsstores.{format}"
+        return self._cached_get(url, format=format)
 
     def create_wms_store(self, body: Union[str, Dict[str, Any]], *, workspace: str) -> str:
         """Creates a new WMS store.
@@ -3649,7 +3915,7 @@ class GeoServer(Base):
             geoserver.create_wms_store(workspace="test", body=body)
             ```
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/wmsstores"
+        url = f"{self._rest_url}/workspaces/{workspace}/wmsstores"
         self._request(method="post", url=url, body=body)
         return CREATED_MESSAGE
 
@@ -3672,9 +3938,8 @@ class GeoServer(Base):
         Returns:
             The WMS store.
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/wmsstores/{name}.{format}"
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        url = f"{self._rest_url}/workspaces/{workspace}/wmsstores/{name}.{format}"
+        return self._get_formatted(url, format=format)
 
     def update_wms_store(self, name: str, body: Union[str, Dict[str, Any]], *, workspace: str) -> str:
         """Modifies a single WMS store.
@@ -3687,7 +3952,7 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/wmsstores/{name}"
+        url = f"{self._rest_url}/workspaces/{workspace}/wmsstores/{name}"
         self._request(method="put", url=url, body=body)
         return UPDATED_MESSAGE
 
@@ -3701,7 +3966,7 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/wmsstores/{name}"
+        url = f"{self._rest_url}/workspaces/{workspace}/wmsstores/{name}"
         self._request(method="delete", url=url)
         return DELETED_MESSAGE
 
@@ -3727,6 +3992,7 @@ class GeoServer(Base):
         format: Literal["xml"],
     ) -> str: ...
 
+    @overload
     def get_wmts_layers(
         self,
         *,
@@ -3734,7 +4000,18 @@ class GeoServer(Base):
         store: Optional[str] = None,
         list: Optional[Literal["available"]] = None,
         format: Literal["json", "xml"] = "json",
-    ) -> Union[str, Dict[str, Any]]:
+        stream: Literal[True],
+    ) -> Iterator[bytes]: ...
+
+    def get_wmts_layers(
+        self,
+        *,
+        workspace: str,
+        store: Optional[str] = None,
+        list: Optional[Literal["available"]] = None,
+        format: Literal["json", "xml"] = "json",
+        stream: bool = False,
+    ) -> Union[str, Dict[str, Any], Iterator[bytes]]:
         """Retrieves the WMTS layers available on the server.
 
         Args:
@@ -3742,17 +4019,23 @@ class GeoServer(Base):
             store: Name of the wmts store.
             list: Set `list=available` to see all possible layers in the store, not just ones currently published.
             format: Optional. The format of the response. It can be either "json" or "xml". Defaults to "json".
+            stream: Optional. When set to `True`, the raw response is returned as an iterator of
+                chunks instead of being loaded in memory, which is useful to feed large catalogs
+                into a streaming parser. Defaults to False.
 
         Returns:
             The WMTS layers.
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/layers.{format}"
         if store is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/wmtsstores/{store}/layers.{format}"
+            url = f"{self._rest_url}/workspaces/{workspace}/wmtsstores/{store}/layers.{format}"
+        else:
+            url = f"{self._rest_url}/workspaces/{workspace}/layers.{format}"
 
         params = dict(list=list)
-        response = self._request(method="get", url=url, params=params)
-        return response.json() if format == "json" else response.text
+        if stream:
+            response = self._request(method="get", url=url, params=params, stream=True)
+            return response.iter_content(chunk_size=65536)
+        return self._get_formatted(url, format=format, params=params)
 
     def wmts_layer_exists(self, name: str, *, workspace: str, store: Optional[str] = None) -> bool:
         """Check if a WMTS layer exists.
@@ -3765,9 +4048,10 @@ class GeoServer(Base):
         Returns:
             True if the WMTS layer exists, False otherwise.
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/layers/{name}.xml"
         if store is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/wmtsstores/{store}/layers/{name}.xml"
+            url = f"{self._rest_url}/workspaces/{workspace}/wmtsstores/{store}/layers/{name}.xml"
+        else:
+            url = f"{self._rest_url}/workspaces/{workspace}/layers/{name}.xml"
 
         response = self._request(method="head", url=url, ignore=[404])
         return response.status_code == 200
@@ -3785,9 +4069,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/layers"
         if store is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/wmtsstores/{store}/layers"
+            url = f"{self._rest_url}/workspaces/{workspace}/wmtsstores/{store}/layers"
+        else:
+            url = f"{self._rest_url}/workspaces/{workspace}/layers"
 
         self._request(method="post", url=url, body=body)
         return CREATED_MESSAGE
@@ -3836,13 +4121,13 @@ class GeoServer(Base):
         Returns:
             The WMTS layer.
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/layers/{name}.{format}"
         if store is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/wmtsstores/{store}/layers/{name}.{format}"
+            url = f"{self._rest_url}/workspaces/{workspace}/wmtsstores/{store}/layers/{name}.{format}"
+        else:
+            url = f"{self._rest_url}/workspaces/{workspace}/layers/{name}.{format}"
 
-        params = dict(quietOnNotFound=quiet_on_not_found)
-        response = self._request(method="get", url=url, params=params)
-        return response.json() if format == "json" else response.text
+        params = _QUIET_PARAMS[quiet_on_not_found]
+        return self._get_formatted(url, format=format, params=params)
 
     def update_wmts_layer(
         self, name: str, body: Union[str, Dict[str, Any]], *, workspace: str, store: Optional[str] = None
@@ -3858,9 +4143,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/layers/{name}"
         if store is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/wmtsstores/{store}/layers/{name}"
+            url = f"{self._rest_url}/workspaces/{workspace}/wmtsstores/{store}/layers/{name}"
+        else:
+            url = f"{self._rest_url}/workspaces/{workspace}/layers/{name}"
 
         self._request(method="put", url=url, body=body)
         return UPDATED_MESSAGE
@@ -3880,9 +4166,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/layers/{name}"
         if store is not None:
-            url = f"{self.service_url}/rest/workspaces/{workspace}/wmtsstores/{store}/layers/{name}"
+            url = f"{self._rest_url}/workspaces/{workspace}/wmtsstores/{store}/layers/{name}"
+        else:
+            url = f"{self._rest_url}/workspaces/{workspace}/layers/{name}"
 
         params = dict(recurse=recurse)
         self._request(method="delete", url=url, params=params)
@@ -3906,9 +4193,8 @@ class GeoServer(Base):
         Returns:
             The WMTS stores.
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/wmtsstores.{format}"
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        url = f"{self._rest_url}/workspaces/{workspace}/wmtsstores.{format}"
+        return self._cached_get(url, format=format)
 
     def wmts_store_exists(self, name: str, *, workspace: str) -> bool:
         """Checks if a WMTS store exists on the server.
@@ -3920,7 +4206,7 @@ class GeoServer(Base):
         Returns:
             True if the WMTS store exists, False otherwise.
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/wmtsstores/{name}.xml"
+        url = f"{self._rest_url}/workspaces/{workspace}/wmtsstores/{name}.xml"
         response = self._request(method="head", url=url, ignore=[404])
         return response.status_code == 200
 
@@ -3934,7 +4220,7 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/wmtsstores"
+        url = f"{self._rest_url}/workspaces/{workspace}/wmtsstores"
         self._request(method="post", url=url, body=body)
         return CREATED_MESSAGE
 
@@ -3957,9 +4243,8 @@ class GeoServer(Base):
         Returns:
             The WMTS store.
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/wmtsstores/{name}.{format}"
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        url = f"{self._rest_url}/workspaces/{workspace}/wmtsstores/{name}.{format}"
+        return self._get_formatted(url, format=format)
 
     def update_wmts_store(self, name: str, body: Union[str, Dict[str, Any]], *, workspace: str) -> str:
         """Modifies a single WMTS store.
@@ -3972,7 +4257,7 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/wmtsstores/{name}"
+        url = f"{self._rest_url}/workspaces/{workspace}/wmtsstores/{name}"
         self._request(method="put", url=url, body=body)
         return UPDATED_MESSAGE
 
@@ -3986,7 +4271,7 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/workspaces/{workspace}/wmtsstores/{name}"
+        url = f"{self._rest_url}/workspaces/{workspace}/wmtsstores/{name}"
         self._request(method="delete", url=url)
         return DELETED_MESSAGE
 
@@ -4007,9 +4292,8 @@ class GeoServer(Base):
         Returns:
             The workspaces.
         """
-        url = f"{self.service_url}/rest/workspaces.{format}"
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        url = f"{self._rest_url}/workspaces.{format}"
+        return self._cached_get(url, format=format)
 
     def workspace_exists(self, name: str) -> bool:
         """Checks if a workspace exists on the server.
@@ -4020,7 +4304,7 @@ class GeoServer(Base):
         Returns:
             True if the workspace exists, False otherwise.
         """
-        url = f"{self.service_url}/rest/workspaces/{name}.xml"
+        url = f"{self._rest_url}/workspaces/{name}.xml"
         response = self._request(method="head", url=url, ignore=[404])
         return response.status_code == 200
 
@@ -4033,7 +4317,7 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/workspaces"
+        url = f"{self._rest_url}/workspaces"
         self._request(method="post", url=url, body=body)
         return CREATED_MESSAGE
 
@@ -4049,6 +4333,29 @@ class GeoServer(Base):
         body = {"workspace": {"name": name}}
         return self.create_workspace(body=body)
 
+    def create_workspaces(self, names: List[str], *, max_workers: int = 8) -> List[str]:
+        """Shortcut to create several workspaces from their names.
+
+        Note:
+            The GeoServer REST API has no bulk workspace endpoint, so the individual requests are
+            issued concurrently to avoid paying one network round-trip per workspace.
+
+        Args:
+            names: The names of the workspaces.
+            max_workers: Optional. The number of concurrent requests. Defaults to 8.
+
+        Returns:
+            One success message per workspace, in the same order as the names.
+
+        Example:
+            To create several workspaces at once, use the following code:
+
+            ```python
+            geoserver.create_workspaces(["workspace1", "workspace2"])
+            ```
+        """
+        return self._map_concurrently(self.create_workspace_from_name, names, max_workers=max_workers)
+
     @overload
     def get_workspace(self, name: str, *, format: Literal["json"] = "json") -> Dict[str, Any]: ...
 
@@ -4065,9 +4372,8 @@ class GeoServer(Base):
         Returns:
             The workspace.
         """
-        url = f"{self.service_url}/rest/workspaces/{name}.{format}"
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        url = f"{self._rest_url}/workspaces/{name}.{format}"
+        return self._get_formatted(url, format=format)
 
     def update_workspace(self, name: str, body: Union[str, Dict[str, Any]]) -> str:
         """Modifies a single workspace.
@@ -4079,7 +4385,7 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/workspaces/{name}"
+        url = f"{self._rest_url}/workspaces/{name}"
         self._request(method="put", url=url, body=body)
         return UPDATED_MESSAGE
 
@@ -4093,7 +4399,7 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/workspaces/{name}"
+        url = f"{self._rest_url}/workspaces/{name}"
         params = dict(recurse=recurse)
         self._request(method="delete", url=url, params=params)
         return DELETED_MESSAGE
@@ -4110,32 +4416,47 @@ class GeoServer(Base):
         self, *, service: Optional[str] = None, group: Optional[str] = None, format: Literal["xml"]
     ) -> str: ...
 
+    @overload
     def get_users(
-        self, *, service: Optional[str] = None, group: Optional[str] = None, format: Literal["json", "xml"] = "json"
-    ) -> Union[str, Dict[str, Any]]:
+        self,
+        *,
+        service: Optional[str] = None,
+        group: Optional[str] = None,
+        format: Literal["json", "xml"] = "json",
+        stream: Literal[True],
+    ) -> Iterator[bytes]: ...
+
+    def get_users(
+        self,
+        *,
+        service: Optional[str] = None,
+        group: Optional[str] = None,
+        format: Literal["json", "xml"] = "json",
+        stream: bool = False,
+    ) -> Union[str, Dict[str, Any], Iterator[bytes]]:
         """Query all users in the default user/group service.
 
         Args:
             service: Optional. The name of the user/group service.
             group: Optional. The name of the group.
             format: Optional. The format of the response. Can be either "json" or "xml".
+            stream: Optional. When set to `True`, the raw response is returned as an iterator of
+                chunks instead of being loaded in memory, which is useful on servers with tens of
+                thousands of users. Defaults to False.
 
         Returns:
             The users.
         """
-        if service is None and group is None:
-            url = f"{self.service_url}/rest/security/usergroup/users.{format}"
-        elif service is not None and group is None:
-            url = f"{self.service_url}/rest/security/usergroup/service/{service}/users.{format}"
-        elif service is None and group is not None:
-            url = f"{self.service_url}/rest/security/usergroup/group/{group}/users.{format}"
-        else:
+        template = _USER_QUERY_URLS.get((service is not None, group is not None))
+        if template is None:
             raise ValueError("Invalid combination of service and group.")
+        url = self._rest_url + template.format(service=service, group=group, format=format)
+        if stream:
+            response = self._request(method="get", url=url, stream=True)
+            return response.iter_content(chunk_size=65536)
+        return self._cached_get(url, format=format)
 
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
-
-    def create_user(self, body: Union[str, Dict[str, Any]], *, service: Optional[str] = None) -> str:
+    def create_user(self, body: Union[str, bytes, Dict[str, Any]], *, service: Optional[str] = None) -> str:
         """Add a new user to the default user/group service.
 
         Args:
@@ -4156,14 +4477,39 @@ class GeoServer(Base):
             geoserver.create_user(body=body)
             ```
         """
-        url = f"{self.service_url}/rest/security/usergroup/users"
         if service is not None:
-            url = f"{self.service_url}/rest/security/usergroup/service/{service}/users"
+            url = f"{self._rest_url}/security/usergroup/service/{service}/users"
+        else:
+            url = f"{self._rest_url}/security/usergroup/users"
 
         self._request(method="post", url=url, body=body)
         return CREATED_MESSAGE
 
-    def update_user(self, name: str, body: Union[str, Dict[str, Any]], *, service: Optional[str] = None) -> str:
+    def create_users(
+        self,
+        bodies: List[Union[str, bytes, Dict[str, Any]]],
+        *,
+        service: Optional[str] = None,
+        max_workers: int = 8,
+    ) -> List[str]:
+        """Add several users to the default user/group service.
+
+        The individual requests are issued concurrently, so bulk provisioning does not pay one
+        network round-trip per user.
+
+        Args:
+            bodies: One request body per user to create, as accepted by `create_user`.
+            service: The name of the user/group service.
+            max_workers: Optional. The number of concurrent requests. Defaults to 8.
+
+        Returns:
+            One success message per user, in the same order as the bodies.
+        """
+        return self._map_concurrently(
+            lambda body: self.create_user(body, service=service), bodies, max_workers=max_workers
+        )
+
+    def update_user(self, name: str, body: Union[str, bytes, Dict[str, Any]], *, service: Optional[str] = None) -> str:
         """Update an existing user in the default user/group service.
 
         Args:
@@ -4189,9 +4535,10 @@ class GeoServer(Base):
             geoserver.update_user("my_user", body=body)
             ```
         """
-        url = f"{self.service_url}/rest/security/usergroup/user/{name}"
         if service is not None:
-            url = f"{self.service_url}/rest/security/usergroup/service/{service}/user/{name}"
+            url = f"{self._rest_url}/security/usergroup/service/{service}/user/{name}"
+        else:
+            url = f"{self._rest_url}/security/usergroup/user/{name}"
 
         self._request(method="post", url=url, body=body)
         return UPDATED_MESSAGE
@@ -4206,13 +4553,32 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/security/usergroup/user/{name}"
         if service is not None:
-            url = f"{self.service_url}/rest/security/usergroup/service/{service}/user/{name}"
+            url = f"{self._rest_url}/security/usergroup/service/{service}/user/{name}"
+        else:
+            url = f"{self._rest_url}/security/usergroup/user/{name}"
 
         self._request(method="delete", url=url)
         return DELETED_MESSAGE
 
+    def delete_users(self, names: List[str], *, service: Optional[str] = None, max_workers: int = 8) -> List[str]:
+        """Remove several existing users from the default user/group service.
+
+        The individual requests are issued concurrently, so bulk clean-ups do not pay one network
+        round-trip per user.
+
+        Args:
+            names: The names of the users.
+            service: The name of the user/group service.
+            max_workers: Optional. The number of concurrent requests. Defaults to 8.
+
+        Returns:
+            One success message per user, in the same order as the names.
+        """
+        return self._map_concurrently(
+            lambda name: self.delete_user(name, service=service), names, max_workers=max_workers
+        )
+
     @overload
     def get_user_groups(
         self, *, user: str, service: Optional[str] = None, format: Literal["json"] = "json"
@@ -4234,12 +4600,12 @@ class GeoServer(Base):
         Returns:
             The groups.
         """
-        url = f"{self.service_url}/rest/security/usergroup/user/{user}/groups.{format}"
         if service is not None:
-            url = f"{self.service_url}/rest/security/usergroup/service/{service}/user/{user}/groups.{format}"
+            url = f"{self._rest_url}/security/usergroup/service/{service}/user/{user}/groups.{format}"
+        else:
+            url = f"{self._rest_url}/security/usergroup/user/{user}/groups.{format}"
 
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        return self._cached_get(url, format=format)
 
     def associate_user(self, user: str, group: str, *, service: Optional[str] = None) -> str:
         """Associate a user with a group in the default user/group service.
@@ -4252,9 +4618,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/security/usergroup/user/{user}/group/{group}"
         if service is not None:
-            url = f"{self.service_url}/rest/security/usergroup/service/{service}/user/{user}/group/{group}"
+            url = f"{self._rest_url}/security/usergroup/service/{service}/user/{user}/group/{group}"
+        else:
+            url = f"{self._rest_url}/security/usergroup/user/{user}/group/{group}"
 
         self._request(method="post", url=url)
         return OK_MESSAGE
@@ -4270,9 +4637,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/security/usergroup/user/{user}/group/{group}"
         if service is not None:
-            url = f"{self.service_url}/rest/security/usergroup/service/{service}/user/{user}/group/{group}"
+            url = f"{self._rest_url}/security/usergroup/service/{service}/user/{user}/group/{group}"
+        else:
+            url = f"{self._rest_url}/security/usergroup/user/{user}/group/{group}"
 
         self._request(method="delete", url=url)
         return OK_MESSAGE
@@ -4287,9 +4655,10 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/security/usergroup/group/{name}"
         if service is not None:
-            url = f"{self.service_url}/rest/security/usergroup/service/{service}/group/{name}"
+            url = f"{self._rest_url}/security/usergroup/service/{service}/group/{name}"
+        else:
+            url = f"{self._rest_url}/security/usergroup/group/{name}"
 
         self._request(method="post", url=url)
         return OK_MESSAGE
@@ -4311,9 +4680,10 @@ class GeoServer(Base):
             geoserver.delete_group(group="group")
             ```
         """
-        url = f"{self.service_url}/rest/security/usergroup/group/{name}"
         if service is not None:
-            url = f"{self.service_url}/rest/security/usergroup/service/{service}/group/{name}"
+            url = f"{self._rest_url}/security/usergroup/service/{service}/group/{name}"
+        else:
+            url = f"{self._rest_url}/security/usergroup/group/{name}"
 
         self._request(method="delete", url=url)
         return OK_MESSAGE
@@ -4340,6 +4710,7 @@ class GeoServer(Base):
         format: Literal["xml"],
     ) -> str: ...
 
+    @overload
     def get_roles(
         self,
         *,
@@ -4347,7 +4718,18 @@ class GeoServer(Base):
         group: Optional[str] = None,
         user: Optional[str] = None,
         format: Literal["json", "xml"] = "json",
-    ) -> Union[str, Dict[str, Any]]:
+        stream: Literal[True],
+    ) -> Iterator[bytes]: ...
+
+    def get_roles(
+        self,
+        *,
+        service: Optional[str] = None,
+        group: Optional[str] = None,
+        user: Optional[str] = None,
+        format: Literal["json", "xml"] = "json",
+        stream: bool = False,
+    ) -> Union[str, Dict[str, Any], Iterator[bytes]]:
         """Query all roles in the default user/group service.
 
         Args:
@@ -4355,6 +4737,9 @@ class GeoServer(Base):
             group: Optional. The name of the group.
             user: Optional. The name of the user.
             format: Optional. The format of the response. Can be either "json" or "xml".
+            stream: Optional. When set to `True`, the raw response is returned as an iterator of
+                chunks instead of being loaded in memory, which is useful on servers with very
+                large role tables. Defaults to False.
 
         Returns:
             The roles.
@@ -4366,21 +4751,14 @@ class GeoServer(Base):
             geoserver.get_roles()
             ```
         """
-        if service is None and group is None and user is None:
-            url = f"{self.service_url}/rest/security/roles.{format}"
-        elif service is not None and group is None and user is None:
-            url = f"{self.service_url}/rest/security/roles/service/{service}.{format}"
-        elif service is None and group is not None and user is None:
-            url = f"{self.service_url}/rest/security/roles/group/{group}.{format}"
-        elif service is not None and group is not None and user is None:
-            url = f"{self.service_url}/rest/security/roles/service/{service}/group/{group}.{format}"
-        elif service is not None and group is None and user is not None:
-            url = f"{self.service_url}/rest/security/roles/service/{service}/user/{user}.{format}"
-        else:
+        template = _ROLE_QUERY_URLS.get((service is not None, group is not None, user is not None))
+        if template is None:
             raise ValueError("Invalid combination of service, group and user.")
-
-        response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        url = self._rest_url + template.format(service=service, group=group, user=user, format=format)
+        if stream:
+            response = self._request(method="get", url=url, stream=True)
+            return response.iter_content(chunk_size=65536)
+        return self._cached_get(url, format=format)
 
     def create_role(self, name: str) -> str:
         """Add a new role to the default user/group service.
@@ -4391,7 +4769,7 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/security/roles/role/{name}"
+        url = f"{self._rest_url}/security/roles/role/{name}"
 
         self._request(method="post", url=url)
         return CREATED_MESSAGE
@@ -4405,7 +4783,7 @@ class GeoServer(Base):
         Returns:
             Success message.
         """
-        url = f"{self.service_url}/rest/security/roles/role/{name}"
+        url = f"{self._rest_url}/security/roles/role/{name}"
 
         self._request(method="delete", url=url)
         return DELETED_MESSAGE
@@ -4431,22 +4809,44 @@ class GeoServer(Base):
             geoserver.associate_role(role="ROLE_ADMIN", user="admin")
             ```
         """
-        if service is not None and group is None and user is None:
-            url = f"{self.service_url}/rest/security/roles/service/{service}/role/{role}"
-        elif service is None and group is None and user is not None:
-            url = f"{self.service_url}/rest/security/roles/role/{role}/user/{user}"
-        elif service is None and group is not None and user is None:
-            url = f"{self.service_url}/rest/security/roles/role/{role}/group/{group}"
-        elif service is not None and group is None and user is not None:
-            url = f"{self.service_url}/rest/security/roles/service/{service}/role/{role}/user/{user}"
-        elif service is not None and group is not None and user is None:
-            url = f"{self.service_url}/rest/security/roles/service/{service}/role/{role}/group/{group}"
-        else:
+        template = _ROLE_MEMBER_URLS.get((service is not None, group is not None, user is not None))
+        if template is None:
             raise ValueError("Invalid combination of service, group and user.")
+        url = self._rest_url + template.format(role=role, service=service, group=group, user=user)
 
         self._request(method="post", url=url)
         return OK_MESSAGE
 
+    def associate_roles(
+        self,
+        roles: List[str],
+        *,
+        service: Optional[str] = None,
+        group: Optional[str] = None,
+        user: Optional[str] = None,
+        max_workers: int = 8,
+    ) -> List[str]:
+        """Associate a user or group with several roles in the default user/group service.
+
+        The individual requests are issued concurrently, so granting a batch of roles does not pay
+        one network round-trip per role.
+
+        Args:
+            roles: The names of the roles.
+            service: The name of the user/group service.
+            group: The name of the group.
+            user: The name of the user.
+            max_workers: Optional. The number of concurrent requests. Defaults to 8.
+
+        Returns:
+            One success message per role, in the same order as the roles.
+        """
+        return self._map_concurrently(
+            lambda role: self.associate_role(role, service=service, group=group, user=user),
+            roles,
+            max_workers=max_workers,
+        )
+
     def disassociate_role(
         self, role: str, *, service: Optional[str] = None, group: Optional[str] = None, user: Optional[str] = None
     ) -> str:
@@ -4468,18 +4868,10 @@ class GeoServer(Base):
             geoserver.disassociate_role(role="ROLE_ADMIN", user="admin")
             ```
         """
-        if service is not None and group is None and user is None:
-            url = f"{self.service_url}/rest/security/roles/service/{service}/role/{role}"
-        elif service is None and group is None and user is not None:
-            url = f"{self.service_url}/rest/security/roles/role/{role}/user/{user}"
-        elif service is None and group is not None and user is None:
-            url = f"{self.service_url}/rest/security/roles/role/{role}/group/{group}"
-        elif service is not None and group is None and user is not None:
-            url = f"{self.service_url}/rest/security/roles/service/{service}/role/{role}/user/{user}"
-        elif service is not None and group is not None and user is None:
-            url = f"{self.service_url}/rest/security/roles/service/{service}/role/{role}/group/{group}"
-        else:
+        template = _ROLE_MEMBER_URLS.get((service is not None, group is not None, user is not None))
+        if template is None:
             raise ValueError("Invalid combination of service, group and user.")
+        url = self._rest_url + template.format(role=role, service=service, group=group, user=user)
 
         self._request(method="delete", url=url)
         return OK_MESSAGE
@@ -22,7 +22,7 @@ class GeoWebCache(Base):
         """
         url = f"{self.service_url}/gwc/rest/blobstores.{format}"
         response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        return self._decode(response, format)
 
     @overload
     def get_blob_store(self, name: str, *, format: Literal["json"] = "json") -> Dict[str, Any]: ...
@@ -42,7 +42,7 @@ class GeoWebCache(Base):
         """
         url = f"{self.service_url}/gwc/rest/blobstores/{name}"
         response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        return self._decode(response, format)
 
     def insert_blob_store(self, name: str, body: Union[str, Dict[str, Any]]) -> str:
         """Creates a new blob store.
@@ -97,7 +97,7 @@ class GeoWebCache(Base):
         """
         url = f"{self.service_url}/gwc/rest/bounds/{layer}/{srs}/{type}.{format}"
         response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        return self._decode(response, format)
 
     # Disk Quota
 
@@ -118,7 +118,7 @@ class GeoWebCache(Base):
         """
         url = f"{self.service_url}/gwc/rest/diskquota.{format}"
         response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        return self._decode(response, format)
 
     def update_diskquota(self, body: Union[str, Dict[str, Any]]) -> str:
         """Modifies the disk quota settings.
@@ -154,7 +154,7 @@ class GeoWebCache(Base):
         """
         url = f"{self.service_url}/gwc/rest/filter/{filter}/update/{update}.{format}"
         response = self._request(method="post", url=url)
-        return response.json() if format == "json" else response.text
+        return self._decode(response, format)
 
     @overload
     def get_global_settings(self, *, format: Literal["json"] = "json") -> Dict[str, Any]: ...
@@ -173,7 +173,7 @@ class GeoWebCache(Base):
         """
         url = f"{self.service_url}/gwc/rest/global.{format}"
         response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        return self._decode(response, format)
 
     def update_global_settings(self, body: Union[str, Dict[str, Any]]) -> str:
         """Modifies the global settings.
@@ -207,7 +207,7 @@ class GeoWebCache(Base):
         """
         url = f"{self.service_url}/gwc/rest/gridsets.{format}"
         response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        return self._decode(response, format)
 
     @overload
     def get_gridset(self, name: str, *, format: Literal["json"] = "json") -> Dict[str, Any]: ...
@@ -227,7 +227,7 @@ class GeoWebCache(Base):
         """
         url = f"{self.service_url}/gwc/rest/gridsets/{name}.{format}"
         response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        return self._decode(response, format)
 
     def insert_gridset(self, name: str, body: Union[str, Dict[str, Any]]) -> str:
         """Creates a new configured gridset on the server, or modifies an existing gridset.
@@ -275,7 +275,7 @@ class GeoWebCache(Base):
         """
         url = f"{self.service_url}/gwc/rest/layers.{format}"
         response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        return self._decode(response, format)
 
     @overload
     def get_layer(self, name: str, *, format: Literal["json"] = "json") -> Dict[str, Any]: ...
@@ -295,7 +295,7 @@ class GeoWebCache(Base):
         """
         url = f"{self.service_url}/gwc/rest/layers/{name}.{format}"
         response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        return self._decode(response, format)
 
     def insert_layer(self, name: str, body: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
         """Creates a new layer on the server, or modifies an existing layer.
@@ -344,7 +344,7 @@ class GeoWebCache(Base):
         url = f"{self.service_url}/gwc/rest/masstruncate.{format}"
         headers = {"Accept": "application/xml"}
         response = self._request(method="get", url=url, headers=headers)
-        return response.json() if format == "json" else response.text
+        return self._decode(response, format)
 
     def create_masstruncate(self, *, request_type: str, layer: str) -> str:
         """Issues a mass truncate request based on the request type parameter.
@@ -382,7 +382,7 @@ class GeoWebCache(Base):
         """
         url = f"{self.service_url}/gwc/rest/statistics.{format}"
         response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        return self._decode(response, format)
 
     # Reload
 
@@ -422,7 +422,7 @@ class GeoWebCache(Base):
         """
         url = f"{self.service_url}/gwc/rest/seed.{format}"
         response = self._request(method="get", url=url)
-        return response.json() if format == "json" else response.text
+        return self._decode(response, format)
 
     # TODO!
 
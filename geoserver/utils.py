@@ -1,4 +1,25 @@
 import re
+from io import BufferedReader
+from pathlib import Path
+from typing import Union
+
+# Leading magic bytes of the zip formats accepted by GeoServer (regular, empty and spanned).
+_ZIP_MAGICS = (b"PK\x03\x04", b"PK\x05\x06", b"PK\x07\x08")
+
+
+def is_zip(file: Union[str, Path, BufferedReader]) -> bool:
+    # Only the first four bytes are read, unlike zipfile.is_zipfile which scans the archive;
+    # this keeps the sniff O(1) no matter how large the upload is.
+    if isinstance(file, (str, Path)):
+        try:
+            with open(file, "rb") as f:
+                return f.read(4).startswith(_ZIP_MAGICS)
+        except OSError:
+            return False
+    position = file.tell()
+    magic = file.read(4)
+    file.seek(position)
+    return magic.startswith(_ZIP_MAGICS)
 
 
 def clean_html(content: str) -> str:
@@ -0,0 +1,289 @@
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Union
+from unittest import mock
+
+import pytest
+import requests
+
+from geoserver import AsyncGeoServer, GeoServer
+
+# These tests exercise the client-side machinery (TTL cache, conditional revalidation, cache
+# invalidation, bulk helpers and the async facade) against a stubbed `Session.request`, so they
+# run without a live GeoServer.
+
+
+def _response(
+    status_code: int = 200,
+    content: bytes = b"{}",
+    headers: Optional[Dict[str, str]] = None,
+    text: str = "",
+) -> mock.Mock:
+    response = mock.Mock()
+    response.status_code = status_code
+    response.content = content
+    response.headers = headers or {}
+    response.text = text
+    response.reason = ""
+    return response
+
+
+# Requests
+
+
+def test_request_invalid_method() -> None:
+    geoserver = GeoServer()
+    with pytest.raises(ValueError):
+        geoserver._request(method="patch", url="http://localhost:8080/geoserver/rest/about/version")  # type: ignore[arg-type]
+
+
+# Cache
+
+
+def test_cached_get_hits_cache() -> None:
+    geoserver = GeoServer(cache_ttl=60)
+    with mock.patch.object(geoserver._session, "request", return_value=_response(content=b'{"styles": {}}')) as request:
+        assert geoserver.get_styles() == {"styles": {}}
+        assert geoserver.get_styles() == {"styles": {}}
+    assert request.call_count == 1
+
+
+def test_cached_get_revalidates_with_etag() -> None:
+    geoserver = GeoServer(cache_ttl=0.01)
+    responses = [
+        _response(content=b'{"styles": {}}', headers={"ETag": '"abc"'}),
+        _response(status_code=304),
+    ]
+    with mock.patch.object(geoserver._session, "request", side_effect=responses) as request:
+        assert geoserver.get_styles() == {"styles": {}}
+        time.sleep(0.02)
+        # The entry expired: the client revalidates with If-None-Match and keeps the cached
+        # value when the server answers 304 Not Modified.
+        assert geoserver.get_styles() == {"styles": {}}
+    assert request.call_count == 2
+    assert request.call_args.kwargs["headers"]["If-None-Match"] == '"abc"'
+
+
+def test_mutation_invalidates_cached_reads() -> None:
+    geoserver = GeoServer(cache_ttl=60)
+    with mock.patch.object(geoserver._session, "request") as request:
+        request.return_value = _response(content=b'{"users": {"user": [{"userName": "bob"}]}}')
+        geoserver.get_users()
+        geoserver.get_users()
+        assert request.call_count == 1
+
+        # Deleting an item must also drop the cached collection listing.
+        geoserver.delete_user("bob")
+        request.return_value = _response(content=b'{"users": {"user": []}}')
+        assert geoserver.get_users() == {"users": {"user": []}}
+    assert request.call_count == 3
+
+
+def test_top_level_create_keeps_unrelated_cache() -> None:
+    geoserver = GeoServer(cache_ttl=60)
+    with mock.patch.object(geoserver._session, "request") as request:
+        request.return_value = _response(content=b'{"users": {"user": []}}')
+        geoserver.get_users()
+
+        # Creating a top-level resource must not wipe cached entries of unrelated collections.
+        request.return_value = _response(status_code=201)
+        geoserver.create_workspace({"workspace": {"name": "demo"}})
+        request.return_value = _response(content=b'{"users": {"user": []}}')
+        geoserver.get_users()
+    assert request.call_count == 2
+
+
+def test_invalidate_cache() -> None:
+    geoserver = GeoServer(cache_ttl=60)
+    with mock.patch.object(geoserver._session, "request", return_value=_response()) as request:
+        geoserver.get_styles()
+        geoserver.invalidate_cache()
+        geoserver.get_styles()
+    assert request.call_count == 2
+
+
+def test_cached_exists() -> None:
+    geoserver = GeoServer(cache_ttl=60)
+    with mock.patch.object(geoserver._session, "request", return_value=_response()) as request:
+        assert geoserver.resource_exists("styles/default_point.sld") is True
+        assert geoserver.resource_exists("styles/default_point.sld") is True
+    assert request.call_count == 1
+
+    with mock.patch.object(geoserver._session, "request", return_value=_response(status_code=404)) as request:
+        assert geoserver.resource_exists("styles/not-found.sld") is False
+        assert geoserver.resource_exists("styles/not-found.sld") is False
+    assert request.call_count == 1
+
+
+def test_style_exists_uses_cached_listing() -> None:
+    geoserver = GeoServer(cache_ttl=60)
+    content = b'{"styles": {"style": [{"name": "point"}]}}'
+    with mock.patch.object(geoserver._session, "request", return_value=_response(content=content)) as request:
+        geoserver.get_styles(workspace="demo")
+        # Membership is answered from the cached listing, without another round-trip.
+        assert geoserver.style_exists("point", workspace="demo") is True
+        assert geoserver.style_exists("line", workspace="demo") is False
+    assert request.call_count == 1
+
+
+def test_coveragestore_exists_uses_cached_listing() -> None:
+    geoserver = GeoServer(cache_ttl=60)
+    content = b'{"coverageStores": {"coverageStore": [{"name": "rasters"}]}}'
+    with mock.patch.object(geoserver._session, "request", return_value=_response(content=content)) as request:
+        geoserver.get_coverage_stores(workspace="demo")
+        assert geoserver.coveragestore_exists("rasters", workspace="demo") is True
+        assert geoserver.coveragestore_exists("dem", workspace="demo") is False
+    assert request.call_count == 1
+
+
+# Bulk helpers
+
+
+def test_create_users() -> None:
+    geoserver = GeoServer()
+    bodies: List[Union[str, bytes, Dict[str, Any]]] = [
+        {"user": {"userName": "user-1"}},
+        {"user": {"userName": "user-2"}},
+    ]
+    with mock.patch.object(geoserver._session, "request", return_value=_response(status_code=201)) as request:
+        msgs = geoserver.create_users(bodies)
+    assert len(msgs) == len(bodies)
+    assert request.call_count == len(bodies)
+
+
+def test_delete_users() -> None:
+    geoserver = GeoServer()
+    names = ["user-1", "user-2"]
+    with mock.patch.object(geoserver._session, "request", return_value=_response()) as request:
+        msgs = geoserver.delete_users(names)
+    assert len(msgs) == len(names)
+    assert request.call_count == len(names)
+
+
+def test_associate_roles() -> None:
+    geoserver = GeoServer()
+    roles = ["role-1", "role-2"]
+    with mock.patch.object(geoserver._session, "request", return_value=_response()) as request:
+        msgs = geoserver.associate_roles(roles, user="bob")
+    assert len(msgs) == len(roles)
+    assert request.call_count == len(roles)
+
+
+def test_bulk_get_data_stores() -> None:
+    geoserver = GeoServer()
+
+    def by_workspace(method: str, url: str, **kwargs: object) -> mock.Mock:
+        workspace = url.split("/workspaces/")[1].split("/")[0]
+        return _response(content=f'{{"workspace": "{workspace}"}}'.encode())
+
+    with mock.patch.object(geoserver._session, "request", side_effect=by_workspace):
+        data = geoserver.bulk_get_data_stores(["ws-1", "ws-2"])
+    assert data == [{"workspace": "ws-1"}, {"workspace": "ws-2"}]
+
+
+def test_bulk_get_coverages() -> None:
+    geoserver = GeoServer()
+    with mock.patch.object(geoserver._session, "request", return_value=_response(content=b'{"coverages": {}}')):
+        data = geoserver.bulk_get_coverages([("ws-1", "store-1"), ("ws-2", "store-2")])
+    assert data == [{"coverages": {}}, {"coverages": {}}]
+
+
+def test_coveragestores_exist() -> None:
+    geoserver = GeoServer()
+
+    def by_name(method: str, url: str, **kwargs: object) -> mock.Mock:
+        return _response(status_code=200 if "/rasters." in url else 404)
+
+    with mock.patch.object(geoserver._session, "request", side_effect=by_name):
+        exists = geoserver.coveragestores_exist(["rasters", "dem"], workspace="demo")
+    assert exists == {"rasters": True, "dem": False}
+
+
+def test_layer_groups_exist() -> None:
+    geoserver = GeoServer()
+
+    def by_name(method: str, url: str, **kwargs: object) -> mock.Mock:
+        return _response(status_code=200 if "/spearfish." in url else 404)
+
+    with mock.patch.object(geoserver._session, "request", side_effect=by_name):
+        exists = geoserver.layer_groups_exist(["spearfish", "tasmania"])
+    assert exists == {"spearfish": True, "tasmania": False}
+
+
+# Shortcuts
+
+
+def test_get_wms_layer_names() -> None:
+    geoserver = GeoServer()
+    with mock.patch.object(geoserver._session, "request") as request:
+        request.return_value = _response(content=b'{"wmsLayers": {"wmsLayer": [{"name": "a"}, {"name": "b"}]}}')
+        assert geoserver.get_wms_layer_names(workspace="demo") == ["a", "b"]
+
+        # A single layer is serialized as a bare dict instead of a one-element list.
+        request.return_value = _response(content=b'{"wmsLayers": {"wmsLayer": {"name": "only"}}}')
+        assert geoserver.get_wms_layer_names(workspace="demo") == ["only"]
+
+        request.return_value = _response(content=b'{"wmsLayers": ""}')
+        assert geoserver.get_wms_layer_names(workspace="demo") == []
+
+        # With list="available" the names come back as plain strings under "list".
+        request.return_value = _response(content=b'{"list": {"string": ["a", "b"]}}')
+        assert geoserver.get_wms_layer_names(workspace="demo", list="available") == ["a", "b"]
+
+        request.return_value = _response(content=b'{"list": {"string": "only"}}')
+        assert geoserver.get_wms_layer_names(workspace="demo", list="available") == ["only"]
+
+
+def test_get_layers_stream() -> None:
+    geoserver = GeoServer()
+    response = _response()
+    response.iter_content.return_value = iter([b'{"layers"', b": {}}"])
+    with mock.patch.object(geoserver._session, "request", return_value=response) as request:
+        chunks = geoserver.get_layers(stream=True)
+        assert b"".join(chunks) == b'{"layers": {}}'
+    assert request.call_args.kwargs["stream"] is True
+
+
+# Lifecycle
+
+
+def test_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GEOSERVER_URL", "http://example.com/geoserver")
+    monkeypatch.setenv("GEOSERVER_USER", "admin")
+    monkeypatch.setenv("GEOSERVER_PASSWORD", "geoserver")
+    geoserver = GeoServer.from_env()
+    assert geoserver.service_url == "http://example.com/geoserver"
+    assert geoserver.auth is not None
+
+
+def test_close_owned_session() -> None:
+    geoserver = GeoServer()
+    with mock.patch.object(geoserver._session, "close") as close:
+        geoserver.close()
+    close.assert_called_once()
+
+
+def test_close_keeps_injected_session_open() -> None:
+    session = requests.Session()
+    geoserver = GeoServer(session=session)
+    with mock.patch.object(session, "close") as close:
+        geoserver.close()
+    close.assert_not_called()
+
+
+def test_context_manager() -> None:
+    with GeoServer() as geoserver:
+        assert isinstance(geoserver, GeoServer)
+
+
+# Async facade
+
+
+def test_async_geoserver() -> None:
+    async def main() -> None:
+        async with AsyncGeoServer() as geoserver:
+            with mock.patch.object(geoserver.client._session, "request", return_value=_response()):
+                data = await geoserver.get_styles()
+        assert data == {}
+
+    asyncio.run(main())
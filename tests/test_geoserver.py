@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Generator, Optional
+from typing import Any, Dict, Generator, List, Optional, Union
 
 import pytest
 from helpers import GEOSERVER_RUNNING, GEOSERVER_URL
@@ -144,6 +144,13 @@ def test_get_data_stores(test_geoserver: GeoServer, test_workspace: str) -> None
     assert e_info.value.status_code == 404
 
 
+@pytest.mark.skipif(not GEOSERVER_RUNNING, reason=f"No GeoServer running at {GEOSERVER_URL!r}.")
+def test_bulk_get_data_stores(test_geoserver: GeoServer, test_workspace: str) -> None:
+    data = test_geoserver.bulk_get_data_stores([test_workspace, test_workspace])
+    assert len(data) == 2
+    assert all(isinstance(item, dict) for item in data)
+
+
 @pytest.mark.skipif(not GEOSERVER_RUNNING, reason=f"No GeoServer running at {GEOSERVER_URL!r}.")
 def test_create_data_store(test_geoserver: GeoServer, test_workspace: str) -> None:
     file_path = Path(TEST_DATA_DIR, "vectors", "buildings.shp").resolve()
@@ -261,6 +268,14 @@ def test_get_coverages(
     assert isinstance(data, dict)
 
 
+@pytest.mark.skipif(not GEOSERVER_RUNNING, reason=f"No GeoServer running at {GEOSERVER_URL!r}.")
+def test_bulk_get_coverages(test_geoserver: GeoServer, test_workspace: str, test_coverage_store: str) -> None:
+    stores = [(test_workspace, test_coverage_store), (test_workspace, test_coverage_store)]
+    data = test_geoserver.bulk_get_coverages(stores)
+    assert len(data) == 2
+    assert all(isinstance(item, dict) for item in data)
+
+
 @pytest.mark.skipif(not GEOSERVER_RUNNING, reason=f"No GeoServer running at {GEOSERVER_URL!r}.")
 @pytest.mark.parametrize("coverage,store", [(TEST_COVERAGE_STORE, TEST_COVERAGE_STORE)])
 def test_create_coverage(
@@ -366,6 +381,12 @@ def test_get_coverage_stores(test_geoserver: GeoServer, test_workspace: str) ->
     assert isinstance(data, dict)
 
 
+@pytest.mark.skipif(not GEOSERVER_RUNNING, reason=f"No GeoServer running at {GEOSERVER_URL!r}.")
+def test_coveragestores_exist(test_geoserver: GeoServer, test_workspace: str, test_coverage_store: str) -> None:
+    exists = test_geoserver.coveragestores_exist([test_coverage_store, "not-found"], workspace=test_workspace)
+    assert exists == {test_coverage_store: True, "not-found": False}
+
+
 @pytest.mark.skipif(not GEOSERVER_RUNNING, reason=f"No GeoServer running at {GEOSERVER_URL!r}.")
 def test_create_coverage_store(test_geoserver: GeoServer, test_workspace: str) -> None:
     file_path = Path(TEST_DATA_DIR, "rasters", "raster.tif").resolve()
@@ -549,6 +570,12 @@ def test_get_layers(test_geoserver: GeoServer, workspace: str) -> None:
     assert isinstance(data, dict)
 
 
+@pytest.mark.skipif(not GEOSERVER_RUNNING, reason=f"No GeoServer running at {GEOSERVER_URL!r}.")
+def test_get_layers_stream(test_geoserver: GeoServer) -> None:
+    chunks = b"".join(test_geoserver.get_layers(stream=True))
+    assert chunks.startswith(b"{")
+
+
 @pytest.mark.skipif(not GEOSERVER_RUNNING, reason=f"No GeoServer running at {GEOSERVER_URL!r}.")
 @pytest.mark.parametrize("workspace", [None, TEST_WORKSPACE])
 def test_create_layer(test_geoserver: GeoServer, workspace: str) -> None: ...
@@ -614,6 +641,12 @@ def test_get_layer_groups(test_geoserver: GeoServer, test_workspace: str) -> Non
     assert isinstance(data, dict)
 
 
+@pytest.mark.skipif(not GEOSERVER_RUNNING, reason=f"No GeoServer running at {GEOSERVER_URL!r}.")
+def test_layer_groups_exist(test_geoserver: GeoServer, test_workspace: str) -> None:
+    exists = test_geoserver.layer_groups_exist(["not-found-1", "not-found-2"], workspace=test_workspace)
+    assert exists == {"not-found-1": False, "not-found-2": False}
+
+
 @pytest.mark.skip("Not implemented yet.")
 @pytest.mark.skipif(not GEOSERVER_RUNNING, reason=f"No GeoServer running at {GEOSERVER_URL!r}.")
 def test_create_layer_group(test_geoserver: GeoServer) -> None: ...
@@ -1183,6 +1216,13 @@ def test_get_wms_layers(test_geoserver: GeoServer, test_workspace: str) -> None:
     assert isinstance(data, dict)
 
 
+@pytest.mark.skipif(not GEOSERVER_RUNNING, reason=f"No GeoServer running at {GEOSERVER_URL!r}.")
+def test_get_wms_layer_names(test_geoserver: GeoServer, test_workspace: str) -> None:
+    names = test_geoserver.get_wms_layer_names(workspace=test_workspace)
+    assert isinstance(names, list)
+    assert all(isinstance(name, str) for name in names)
+
+
 @pytest.mark.skip("Not implemented yet.")
 @pytest.mark.skipif(not GEOSERVER_RUNNING, reason=f"No GeoServer running at {GEOSERVER_URL!r}.")
 def test_create_wms_layer(test_geoserver: GeoServer, test_workspace: str) -> None: ...
@@ -1291,6 +1331,16 @@ def test_create_workspace(test_geoserver: GeoServer) -> None:
     assert e_info.value.status_code == 409
 
 
+@pytest.mark.skipif(not GEOSERVER_RUNNING, reason=f"No GeoServer running at {GEOSERVER_URL!r}.")
+def test_create_workspaces(test_geoserver: GeoServer) -> None:
+    workspaces = ["tmp-workspace-1", "tmp-workspace-2"]
+    msgs = test_geoserver.create_workspaces(workspaces)
+    assert len(msgs) == len(workspaces)
+
+    for workspace in workspaces:
+        test_geoserver.delete_workspace(workspace)
+
+
 @pytest.mark.skipif(not GEOSERVER_RUNNING, reason=f"No GeoServer running at {GEOSERVER_URL!r}.")
 def test_get_workspace(test_geoserver: GeoServer, test_workspace: str) -> None:
     data = test_geoserver.get_workspace(test_workspace)
@@ -1405,6 +1455,23 @@ def test_delete_user(test_geoserver: GeoServer, username: str, service: Optional
     assert e_info.value.status_code == 404
 
 
+@pytest.mark.skipif(not GEOSERVER_RUNNING, reason=f"No GeoServer running at {GEOSERVER_URL!r}.")
+def test_create_users(test_geoserver: GeoServer) -> None:
+    bodies: List[Union[str, bytes, Dict[str, Any]]] = [
+        {"user": {"userName": "bulk-user-1", "password": "password", "enabled": True}},
+        {"user": {"userName": "bulk-user-2", "password": "password", "enabled": True}},
+    ]
+    msgs = test_geoserver.create_users(bodies)
+    assert len(msgs) == len(bodies)
+
+
+@pytest.mark.skipif(not GEOSERVER_RUNNING, reason=f"No GeoServer running at {GEOSERVER_URL!r}.")
+def test_delete_users(test_geoserver: GeoServer) -> None:
+    usernames = ["bulk-user-1", "bulk-user-2"]
+    msgs = test_geoserver.delete_users(usernames)
+    assert len(msgs) == len(usernames)
+
+
 @pytest.mark.skipif(not GEOSERVER_RUNNING, reason=f"No GeoServer running at {GEOSERVER_URL!r}.")
 @pytest.mark.parametrize("service", [None, "default"])
 def test_get_user_groups(test_geoserver: GeoServer, test_user: str, service: Optional[str]) -> None:
@@ -1558,6 +1625,20 @@ def test_associate_role(
     assert isinstance(msg, str)
 
 
+@pytest.mark.skipif(not GEOSERVER_RUNNING, reason=f"No GeoServer running at {GEOSERVER_URL!r}.")
+def test_associate_roles(test_geoserver: GeoServer, test_user: str) -> None:
+    roles = ["bulk-role-1", "bulk-role-2"]
+    for role in roles:
+        test_geoserver.create_role(role)
+
+    msgs = test_geoserver.associate_roles(roles, user=test_user)
+    assert len(msgs) == len(roles)
+
+    for role in roles:
+        test_geoserver.disassociate_role(role=role, user=test_user)
+        test_geoserver.delete_role(role)
+
+
 @pytest.mark.skipif(not GEOSERVER_RUNNING, reason=f"No GeoServer running at {GEOSERVER_URL!r}.")
 @pytest.mark.parametrize(
     "role,service,group,user",